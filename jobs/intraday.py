@@ -24,6 +24,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
@@ -43,8 +44,8 @@ from lib.polygon_client import (  # noqa: E402
 from lib.signals import compute_all_signals  # noqa: E402
 from lib.scoring import (  # noqa: E402
     normalize_today,
-    compute_intraday_dirscore,
-    resolve_intraday_decision,
+    compute_intraday_dirscore_vectorized,
+    resolve_intraday_decision_vectorized,
 )
 from lib.supa import insert_rows, SUPA  # noqa: E402
 from lib.finnhub_client import get_earnings_events
@@ -55,7 +56,25 @@ import config  # noqa: E402  # pylint: disable=unused-import
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _med20_volumes(symbol: str, trade_date: date) -> Optional[Tuple[float, float]]:
+    """
+    Stage 8 (call, put) baseline volumes from 30 days of daily bars.
+
+    Memoized per ``(symbol, trade_date)`` so repeated nowcast cycles in a day
+    reuse one Polygon call. Errors propagate and are therefore not cached.
+    """
+    bars = get_underlying_agg(
+        symbol, trade_date - timedelta(days=30), trade_date, timespan="day"
+    )
+    volumes = [bar.get("volume") for bar in bars if bar.get("volume")]
+    if not volumes:
+        return None
+    median_vol = float(np.median(volumes))
+    return median_vol * 0.05 * 0.6, median_vol * 0.05 * 0.4
+
+
+@dataclass(frozen=True, slots=True)
 class IntradaySnapshot:
     """Container for raw intraday signal inputs prior to scoring."""
 
@@ -131,14 +150,9 @@ class IntradayJob:
         """Estimate 20-day baseline volumes using the Stage 8 heuristic."""
 
         try:
-            end = self.trade_date
-            start = end - timedelta(days=30)
-            bars = get_underlying_agg(symbol, start, end, timespan="day")
-            volumes = [bar.get("volume") for bar in bars if bar.get("volume")]
-            if volumes:
-                median_vol = float(np.median(volumes))
-                call_med20 = median_vol * 0.05 * 0.6
-                put_med20 = median_vol * 0.05 * 0.4
+            baseline = _med20_volumes(symbol, self.trade_date)
+            if baseline is not None:
+                call_med20, put_med20 = baseline
                 return {
                     "call_med20": call_med20,
                     "put_med20": put_med20,
@@ -148,6 +162,11 @@ class IntradayJob:
 
         return {"call_med20": 10000.0, "put_med20": 8000.0}
 
+    @staticmethod
+    def clear_volume_cache() -> None:
+        """Drop memoized med20 baselines (e.g. in a long-lived worker)."""
+        _med20_volumes.cache_clear()
+
     @staticmethod
     def _sum_option_volume(contracts: List[Dict], option_type: str) -> float:
         """Aggregate volume across contracts for a given option type."""
@@ -219,7 +238,7 @@ class IntradayJob:
             # Assume earnings are after market close for simplicity (16:00)
             earnings_ts = datetime.combine(earnings_date, datetime.min.time()).replace(hour=16, minute=0)
             expiry_info = find_event_and_neighbors(earnings_ts, expiries)
-            event_expiry = expiry_info.get("event")
+            event_expiry = expiry_info.event
             
             if not event_expiry:
                 print(f"   - {symbol}: No suitable event expiry found for earnings on {earnings_date}")
@@ -353,19 +372,25 @@ class IntradayJob:
             winsorize_std=2.0,
         )
 
+        scores, directions = compute_intraday_dirscore_vectorized(df_norm)
+        decisions, structures = resolve_intraday_decision_vectorized(
+            scores,
+            df_norm.get("pct_iv_bump"),
+            df_norm.get("spread_pct_atm"),
+            df_norm.get("total_volume"),
+        )
+        # Passed rows carry no direction (their structure is already SKIP)
+        directions = np.where(decisions == "PASS", "NONE", directions)
+
         records: List[Dict] = []
 
-        for _, row in df_norm.iterrows():
-            score_now, direction = compute_intraday_dirscore(row)
-            pct_iv = row.get("pct_iv_bump")
-            spread_pct = row.get("spread_pct_atm")
-            total_volume = row.get("total_volume")
-            decision, structure = resolve_intraday_decision(
-                score_now,
-                pct_iv,
-                spread_pct,
-                total_volume,
-            )
+        for (_, row), score, direction, decision, structure in zip(
+            df_norm.iterrows(), scores, directions, decisions, structures
+        ):
+            score_now = float(score)
+            direction = str(direction)
+            decision = str(decision)
+            structure = str(structure)
 
             prev = self._fetch_previous_score(row["symbol"])
             prev_ewma = prev.get("dirscore_ewma")
@@ -380,10 +405,6 @@ class IntradayJob:
                     size_reduction = 0.5
                     notes = "WHIPSAW_REDUCE"
 
-            if decision == "PASS":
-                direction = "NONE"
-                structure = "SKIP"
-
             records.append({
                 "symbol": row["symbol"],
                 "event_date": row.get("event_date"),
@@ -112,31 +112,31 @@ class PostCloseJob:
         chains = {}
         
         # Event expiry
-        if expiries["event"]:
+        if expiries.event:
             chains["event"] = get_chain_snapshot(
                 symbol,
-                expiries["event"],
-                expiries["event"]
+                expiries.event,
+                expiries.event
             )
         else:
             chains["event"] = []
         
         # Prev expiry
-        if expiries["prev"]:
+        if expiries.prev:
             chains["prev"] = get_chain_snapshot(
                 symbol,
-                expiries["prev"],
-                expiries["prev"]
+                expiries.prev,
+                expiries.prev
             )
         else:
             chains["prev"] = []
         
         # Next expiry
-        if expiries["next"]:
+        if expiries.next:
             chains["next"] = get_chain_snapshot(
                 symbol,
-                expiries["next"],
-                expiries["next"]
+                expiries.next,
+                expiries.next
             )
         else:
             chains["next"] = []
@@ -316,7 +316,7 @@ class PostCloseJob:
             Dict with computed signals, or None if insufficient data
         """
         symbol = event["symbol"]
-        event_date = event["expiries"]["event"]
+        event_date = event["expiries"].event
         
         try:
             # Compute 20-day volume baseline
@@ -508,7 +508,7 @@ class PostCloseJob:
                 # Find event and neighbor expiries
                 expiry_dates = find_event_and_neighbors(earnings_ts, expiries)
                 
-                if not expiry_dates["event"]:
+                if not expiry_dates.event:
                     print(f"   - {symbol}: No valid event expiry, skipping")
                     continue
                 
@@ -13,9 +13,10 @@ Responsibilities:
 import sys
 from pathlib import Path
 from dataclasses import dataclass
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Allow direct imports from lib/
@@ -24,12 +25,40 @@ sys.path.insert(0, str(project_root / "lib"))
 sys.path.insert(0, str(project_root / "config"))
 
 from lib.polygon_client import get_chain_snapshot  # noqa: E402
-from lib.supa import SUPA, upsert_rows  # noqa: E402
-from lib.scoring import normalize_today, compute_dirscore  # noqa: E402
+from lib.supa import (  # noqa: E402
+    DAILY_SIGNALS_TBL,
+    OPTION_SNAPSHOTS_TBL,
+    upsert_rows,
+)
+from lib.scoring import normalize_today, compute_dirscore_vectorized  # noqa: E402
 import config  # noqa: E402  # pylint: disable=unused-import
 
+# Rows per Supabase upsert request
+UPSERT_BATCH_SIZE = 10_000
 
-@dataclass
+# Option tickers per ``in_`` filter when reading prior snapshots
+SNAPSHOT_QUERY_CHUNK = 500
+
+# Rows per page when reading prior snapshots (PostgREST caps responses at 1000)
+SNAPSHOT_PAGE_SIZE = 1000
+
+# Raw signal columns written back to ``public.daily_signals`` on recompute
+PERSISTED_SIGNAL_COLUMNS = [
+    "rr_25d",
+    "pcr_volume",
+    "pcr_notional",
+    "vol_thrust_calls",
+    "vol_thrust_puts",
+    "atm_iv_event",
+    "atm_iv_prev",
+    "atm_iv_next",
+    "iv_bump",
+    "spread_pct_atm",
+    "mom_3d_betaadj",
+]
+
+
+@dataclass(frozen=True, slots=True)
 class OIDeltaResult:
     """Container for ΔOI calculations."""
 
@@ -83,9 +112,7 @@ class PreMarketJob:
         """
         print("\n1. Loading prior daily signals...")
         response = (
-            SUPA.schema("public")
-            .table("daily_signals")
-            .select("*")
+            DAILY_SIGNALS_TBL.select("*")
             .eq("trade_date", self.trade_date.isoformat())
             .execute()
         )
@@ -146,6 +173,30 @@ class PreMarketJob:
             print(f"      ✗ Snapshot failed: {exc}")
             return []
 
+    # ------------------------------------------------------------------ #
+    # Persistence helpers
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _upsert_batched(
+        table: str,
+        rows: List[Dict],
+        on_conflict: Optional[str] = None,
+    ) -> None:
+        """
+        Upsert rows in chunks of ``UPSERT_BATCH_SIZE`` per request.
+
+        Args:
+            table: Schema-qualified table name.
+            rows: Rows to write.
+            on_conflict: Conflict target passed through to ``upsert_rows``.
+        """
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            upsert_rows(
+                table,
+                rows[start : start + UPSERT_BATCH_SIZE],
+                on_conflict=on_conflict,
+            )
+
     # ------------------------------------------------------------------ #
     # ΔOI computation
     # ------------------------------------------------------------------ #
@@ -169,26 +220,23 @@ class PreMarketJob:
         Returns:
             Sorted list of strikes to include.
         """
-        strikes = sorted(
-            {
-                float(contract.get("details", {}).get("strike_price"))
-                for contract in contracts
-                if contract.get("details", {}).get("strike_price") is not None
-            }
+        strike_values = (
+            contract.get("details", {}).get("strike_price") for contract in contracts
+        )
+        strikes = np.unique(
+            np.fromiter(
+                (float(strike) for strike in strike_values if strike is not None),
+                dtype=np.float64,
+            )
         )
 
-        if not strikes:
+        if strikes.size == 0:
             return []
 
-        closest_idx = min(
-            range(len(strikes)),
-            key=lambda idx: abs(strikes[idx] - spot_price),
-        )
+        closest_idx = int(np.argmin(np.abs(strikes - spot_price)))
 
         start_idx = max(0, closest_idx - 2)
-        end_idx = min(len(strikes) - 1, closest_idx + 2)
-
-        return strikes[start_idx : end_idx + 1]
+        return strikes[start_idx : closest_idx + 3].tolist()
 
     def _analyze_contracts(
         self,
@@ -204,21 +252,29 @@ class PreMarketJob:
         if not target_strikes:
             return [], []
 
-        strike_set = set(target_strikes)
-        call_contracts: List[Dict] = []
-        put_contracts: List[Dict] = []
+        if not contracts:
+            return [], []
 
-        for contract in contracts:
-            details = contract.get("details", {})
-            strike = details.get("strike_price")
-            contract_type = details.get("contract_type", "").lower()
-            if strike is None or float(strike) not in strike_set:
-                continue
+        # One pass to pull strike and leading type letter, then mask once
+        details = [contract.get("details", {}) for contract in contracts]
+        strikes = np.array(
+            [
+                np.nan if d.get("strike_price") is None else float(d["strike_price"])
+                for d in details
+            ],
+            dtype=float,
+        )
+        type_codes = np.array(
+            [(d.get("contract_type") or " ")[0].lower() for d in details]
+        )
+        in_window = np.isin(strikes, np.asarray(target_strikes, dtype=float))
 
-            if contract_type == "call":
-                call_contracts.append(contract)
-            elif contract_type == "put":
-                put_contracts.append(contract)
+        call_contracts = [
+            contracts[i] for i in np.flatnonzero(in_window & (type_codes == "c"))
+        ]
+        put_contracts = [
+            contracts[i] for i in np.flatnonzero(in_window & (type_codes == "p"))
+        ]
 
         return call_contracts, put_contracts
 
@@ -241,30 +297,52 @@ class PreMarketJob:
         """
         Fetch most recent stored OI for each contract.
 
+        Queries ``public.option_snapshots`` with ``in_`` filters of at most
+        ``SNAPSHOT_QUERY_CHUNK`` tickers to stay under URL-length limits.
+        Reads are bounded to snapshots taken from the start of ``trade_date``
+        up to this run's ``asof_ts``, so round-trips scale with the tickers
+        rather than the table's history; within that window each chunk is
+        paged ``SNAPSHOT_PAGE_SIZE`` rows at a time until a short page, so no
+        ticker is lost to the response cap.
+
         Args:
             option_symbols: List of Polygon option tickers.
         """
         if not option_symbols:
             return {}
 
-        response = (
-            SUPA.schema("public")
-            .table("option_snapshots")
-            .select("option_symbol,oi,asof_ts")
-            .in_("option_symbol", option_symbols)
-            .order("asof_ts", desc=True)
-            .execute()
-        )
-
         latest: Dict[str, int] = {}
-        for row in response.data or []:
-            option_symbol = row.get("option_symbol")
-            if not option_symbol or option_symbol in latest:
-                continue
-            oi_value = row.get("oi")
-            if oi_value is None:
-                continue
-            latest[option_symbol] = int(oi_value)
+        unique_symbols = list(dict.fromkeys(option_symbols))
+        window_start = datetime.combine(self.trade_date, time.min).isoformat()
+        window_end = self.asof_ts.isoformat()
+        for start in range(0, len(unique_symbols), SNAPSHOT_QUERY_CHUNK):
+            chunk = unique_symbols[start : start + SNAPSHOT_QUERY_CHUNK]
+            offset = 0
+            while True:
+                response = (
+                    OPTION_SNAPSHOTS_TBL.select("option_symbol,oi,asof_ts")
+                    .in_("option_symbol", chunk)
+                    .gte("asof_ts", window_start)
+                    .lt("asof_ts", window_end)
+                    .order("asof_ts", desc=True)
+                    .order("option_symbol")
+                    .range(offset, offset + SNAPSHOT_PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = response.data or []
+
+                for row in rows:
+                    option_symbol = row.get("option_symbol")
+                    if not option_symbol or option_symbol in latest:
+                        continue
+                    oi_value = row.get("oi")
+                    if oi_value is None:
+                        continue
+                    latest[option_symbol] = int(oi_value)
+
+                if len(rows) < SNAPSHOT_PAGE_SIZE:
+                    break
+                offset += SNAPSHOT_PAGE_SIZE
 
         return latest
 
@@ -305,44 +383,28 @@ class PreMarketJob:
             )
         return rows
 
-    def compute_delta_for_symbol(
+    def _window_contracts(
         self,
         symbol: str,
-        event_expiry: date,
-    ) -> OIDeltaResult:
-        """
-        Compute ΔOI for a single symbol/event pair.
+        event_expiry: Optional[date],
+    ) -> Tuple[List[Dict], List[Dict], str]:
         """
-        print(f"\n   Processing {symbol} (event expiry {event_expiry})")
+        Snapshot the event chain and slice it to the ATM ±2 strike window.
 
+        Returns:
+            (call_contracts, put_contracts, detail) where detail names the
+            failure reason and is empty on success.
+        """
         if event_expiry is None:
-            return OIDeltaResult(
-                symbol=symbol,
-                event_expiry=self.trade_date,
-                delta_oi_calls=None,
-                delta_oi_puts=None,
-                detail="missing_event_expiry",
-            )
+            return [], [], "missing_event_expiry"
 
         contracts = self.snapshot_event_contracts(symbol, event_expiry)
         if not contracts:
-            return OIDeltaResult(
-                symbol=symbol,
-                event_expiry=event_expiry,
-                delta_oi_calls=None,
-                delta_oi_puts=None,
-                detail="empty_snapshot",
-            )
+            return [], [], "empty_snapshot"
 
         spot_price = self._extract_spot_price(contracts)
         if spot_price is None:
-            return OIDeltaResult(
-                symbol=symbol,
-                event_expiry=event_expiry,
-                delta_oi_calls=None,
-                delta_oi_puts=None,
-                detail="missing_spot",
-            )
+            return [], [], "missing_spot"
 
         target_strikes = self._atm_window_strikes(contracts, spot_price)
         call_contracts, put_contracts = self._analyze_contracts(
@@ -351,21 +413,28 @@ class PreMarketJob:
         )
 
         if not call_contracts and not put_contracts:
-            return OIDeltaResult(
-                symbol=symbol,
-                event_expiry=event_expiry,
-                delta_oi_calls=None,
-                delta_oi_puts=None,
-                detail="no_contracts_in_window",
-            )
+            return [], [], "no_contracts_in_window"
 
-        option_symbols = [
-            contract.get("ticker")
-            for contract in call_contracts + put_contracts
-            if contract.get("ticker")
+        return call_contracts, put_contracts, ""
+
+    @staticmethod
+    def _option_symbols(contracts: List[Dict]) -> List[str]:
+        """Polygon option tickers present in ``contracts``."""
+        return [
+            contract.get("ticker") for contract in contracts if contract.get("ticker")
         ]
-        previous_oi = self._latest_snapshot_oi(option_symbols)
 
+    def _delta_from_window(
+        self,
+        symbol: str,
+        event_expiry: date,
+        call_contracts: List[Dict],
+        put_contracts: List[Dict],
+        previous_oi: Dict[str, int],
+    ) -> OIDeltaResult:
+        """
+        Compute ΔOI for a windowed chain and store the new snapshot rows.
+        """
         current_calls = self._current_oi_totals(call_contracts)
         current_puts = self._current_oi_totals(put_contracts)
 
@@ -399,6 +468,73 @@ class PreMarketJob:
             delta_oi_puts=int(delta_puts),
         )
 
+    def compute_delta_for_symbol(
+        self,
+        symbol: str,
+        event_expiry: date,
+    ) -> OIDeltaResult:
+        """
+        Compute ΔOI for a single symbol/event pair.
+        """
+        return self.compute_deltas([(symbol, event_expiry)])[0]
+
+    def compute_deltas(
+        self,
+        symbol_expiries: List[Tuple[str, Optional[date]]],
+    ) -> List[OIDeltaResult]:
+        """
+        Compute ΔOI for many symbol/event pairs.
+
+        Chains are snapshotted per symbol, then prior OI for every windowed
+        contract is read from ``public.option_snapshots`` in one bulk lookup
+        instead of one query per symbol.
+
+        Args:
+            symbol_expiries: (symbol, event_expiry) pairs.
+
+        Returns:
+            One OIDeltaResult per input pair, in input order.
+        """
+        windows = []
+        for symbol, event_expiry in symbol_expiries:
+            print(f"\n   Processing {symbol} (event expiry {event_expiry})")
+            windows.append(self._window_contracts(symbol, event_expiry))
+
+        option_symbols = [
+            option_symbol
+            for call_contracts, put_contracts, _ in windows
+            for option_symbol in self._option_symbols(call_contracts + put_contracts)
+        ]
+        previous_oi = self._latest_snapshot_oi(option_symbols)
+
+        results: List[OIDeltaResult] = []
+        for (symbol, event_expiry), (call_contracts, put_contracts, detail) in zip(
+            symbol_expiries, windows
+        ):
+            if detail:
+                results.append(
+                    OIDeltaResult(
+                        symbol=symbol,
+                        event_expiry=event_expiry or self.trade_date,
+                        delta_oi_calls=None,
+                        delta_oi_puts=None,
+                        detail=detail,
+                    )
+                )
+                continue
+
+            results.append(
+                self._delta_from_window(
+                    symbol,
+                    event_expiry,
+                    call_contracts,
+                    put_contracts,
+                    previous_oi,
+                )
+            )
+
+        return results
+
     # ------------------------------------------------------------------ #
     # DirScore refresh
     # ------------------------------------------------------------------ #
@@ -414,16 +550,18 @@ class PreMarketJob:
             print("\n   Skipping DirScore recompute (insufficient data)")
             return signals_df
 
+        # Assemble ΔOI column-wise and build the frame once
+        valid = [
+            item
+            for item in delta_results
+            if item.delta_oi_calls is not None and item.delta_oi_puts is not None
+        ]
         delta_frame = pd.DataFrame(
-            [
-                {
-                    "symbol": item.symbol,
-                    "delta_oi_calls": item.delta_oi_calls,
-                    "delta_oi_puts": item.delta_oi_puts,
-                }
-                for item in delta_results
-                if item.delta_oi_calls is not None and item.delta_oi_puts is not None
-            ]
+            {
+                "symbol": [item.symbol for item in valid],
+                "delta_oi_calls": [item.delta_oi_calls for item in valid],
+                "delta_oi_puts": [item.delta_oi_puts for item in valid],
+            }
         )
 
         if delta_frame.empty:
@@ -431,18 +569,25 @@ class PreMarketJob:
             return signals_df
 
         df = signals_df.merge(delta_frame, on="symbol", how="left")
-        df["delta_oi_calls"] = df["delta_oi_calls"].fillna(0).astype(int)
-        df["delta_oi_puts"] = df["delta_oi_puts"].fillna(0).astype(int)
-        df["delta_oi_net"] = df["delta_oi_calls"] - df["delta_oi_puts"]
-        df["net_thrust"] = (
-            df["vol_thrust_calls"].fillna(0.0) - df["vol_thrust_puts"].fillna(0.0)
-        )
+
+        # Derive every model input up front and attach them in one assign
+        delta_calls = df["delta_oi_calls"].fillna(0).astype(int)
+        delta_puts = df["delta_oi_puts"].fillna(0).astype(int)
+        derived = {
+            "delta_oi_calls": delta_calls,
+            "delta_oi_puts": delta_puts,
+            "delta_oi_net": delta_calls - delta_puts,
+            "net_thrust": (
+                df["vol_thrust_calls"].fillna(0.0) - df["vol_thrust_puts"].fillna(0.0)
+            ),
+        }
         if "pcr_volume" in df.columns:
-            df["vol_pcr"] = pd.to_numeric(df["pcr_volume"], errors="coerce")
+            derived["vol_pcr"] = pd.to_numeric(df["pcr_volume"], errors="coerce")
         if "mom_3d_betaadj" in df.columns:
-            df["beta_adj_return"] = pd.to_numeric(
+            derived["beta_adj_return"] = pd.to_numeric(
                 df["mom_3d_betaadj"], errors="coerce"
             )
+        df = df.assign(**derived)
 
         signal_columns = [
             "rr_25d",
@@ -455,44 +600,33 @@ class PreMarketJob:
         ]
 
         df_norm = normalize_today(df, signal_columns=signal_columns)
-        score_and_decision = df_norm.apply(
-            lambda row: pd.Series(compute_dirscore(row)), axis=1
+        scores, decisions = compute_dirscore_vectorized(df_norm)
+        df_norm = df_norm.assign(dirscore=scores, decision=decisions)
+
+        # Persist the refreshed scores (built column-wise, one records pass)
+        persisted = {
+            "trade_date": self.trade_date.isoformat(),
+            "symbol": df_norm["symbol"],
+            "event_expiry": df_norm["event_expiry"].map(
+                lambda value: value.isoformat()
+                if isinstance(value, (date, datetime))
+                else value
+            ),
+        }
+        for col in PERSISTED_SIGNAL_COLUMNS:
+            persisted[col] = df_norm[col] if col in df_norm.columns else None
+        persisted["dirscore"] = (
+            pd.to_numeric(df_norm["dirscore"], errors="coerce")
+            .astype(object)
+            .where(df_norm["dirscore"].notna(), None)
         )
-        df_norm["dirscore"] = score_and_decision[0]
-        df_norm["decision"] = score_and_decision[1]
-
-        # Persist the refreshed scores
-        rows = []
-        for _, row in df_norm.iterrows():
-            rows.append(
-                {
-                    "trade_date": self.trade_date.isoformat(),
-                    "symbol": row["symbol"],
-                    "event_expiry": (
-                        row["event_expiry"].isoformat()
-                        if isinstance(row["event_expiry"], (date, datetime))
-                        else row["event_expiry"]
-                    ),
-                    "rr_25d": row.get("rr_25d"),
-                    "pcr_volume": row.get("pcr_volume"),
-                    "pcr_notional": row.get("pcr_notional"),
-                    "vol_thrust_calls": row.get("vol_thrust_calls"),
-                    "vol_thrust_puts": row.get("vol_thrust_puts"),
-                    "atm_iv_event": row.get("atm_iv_event"),
-                    "atm_iv_prev": row.get("atm_iv_prev"),
-                    "atm_iv_next": row.get("atm_iv_next"),
-                    "iv_bump": row.get("iv_bump"),
-                    "spread_pct_atm": row.get("spread_pct_atm"),
-                    "mom_3d_betaadj": row.get("mom_3d_betaadj"),
-                    "dirscore": float(row.get("dirscore"))
-                    if not pd.isna(row.get("dirscore"))
-                    else None,
-                    "decision": row.get("decision"),
-                }
-            )
+        persisted["decision"] = df_norm["decision"]
+        rows = pd.DataFrame(persisted, index=df_norm.index).to_dict("records")
 
         try:
-            upsert_rows("public.daily_signals", rows, on_conflict="trade_date,symbol")
+            self._upsert_batched(
+                "public.daily_signals", rows, on_conflict="trade_date,symbol"
+            )
             print(f"\n   ✓ Updated DirScore for {len(rows)} rows")
         except Exception as exc:  # pragma: no cover - supabase write
             print(f"\n   ✗ Failed to update daily_signals: {exc}")
@@ -508,15 +642,15 @@ class PreMarketJob:
         if signals_df.empty:
             return []
 
-        delta_results: List[OIDeltaResult] = []
-
         print("\n2. Computing ΔOI by symbol...")
-        for _, row in signals_df.iterrows():
-            result = self.compute_delta_for_symbol(
-                symbol=row["symbol"],
-                event_expiry=row.get("event_expiry"),
-            )
-            delta_results.append(result)
+        event_expiries = (
+            signals_df["event_expiry"]
+            if "event_expiry" in signals_df.columns
+            else pd.Series(None, index=signals_df.index)
+        )
+        delta_results = self.compute_deltas(
+            list(zip(signals_df["symbol"], event_expiries))
+        )
 
         successful = [
             item for item in delta_results if item.delta_oi_calls is not None
@@ -535,7 +669,9 @@ class PreMarketJob:
                 for item in successful
             ]
             try:
-                upsert_rows("public.oi_deltas", rows, on_conflict="trade_date,symbol")
+                self._upsert_batched(
+                    "public.oi_deltas", rows, on_conflict="trade_date,symbol"
+                )
                 print(f"\n3. ✓ Wrote {len(rows)} ΔOI rows to public.oi_deltas")
             except Exception as exc:  # pragma: no cover - supabase write
                 print(f"\n3. ✗ Failed to write ΔOI rows: {exc}")
@@ -9,6 +9,7 @@ __version__ = "0.1.0"
 from .finnhub_client import get_upcoming_earnings, get_earnings_events
 from .polygon_client import (
     get_expiries,       
+    get_expiries_batch,
     get_chain_snapshot,
     get_underlying_agg,
     get_option_daily_oc
@@ -16,6 +17,7 @@ from .polygon_client import (
 
 # Export event/expiry selection functions
 from .events import (
+    EventExpiries,
     find_event_and_neighbors,
     validate_event_expiries,
     get_expiry_ranges,
@@ -32,7 +34,8 @@ from .signals import (
     compute_iv_bump,
     compute_spread_pct_atm,
     compute_mom_betaadj,
-    compute_all_signals
+    compute_all_signals,
+    compute_all_signals_batch
 )
 
 # Export normalization and scoring functions (Dev Stage 7)
@@ -42,9 +45,12 @@ from .scoring import (
     IntradayScore,
     normalize_today,
     compute_dirscore,
+    compute_dirscore_vectorized,
     compute_scores_batch,
     compute_intraday_dirscore,
-    resolve_intraday_decision
+    compute_intraday_dirscore_vectorized,
+    resolve_intraday_decision,
+    resolve_intraday_decision_vectorized
 )
 
 __all__ = [
@@ -52,10 +58,12 @@ __all__ = [
     "get_upcoming_earnings",
     "get_earnings_events",
     "get_expiries", 
+    "get_expiries_batch",
     "get_chain_snapshot",
     "get_underlying_agg",
     "get_option_daily_oc",
     # Event selection
+    "EventExpiries",
     "find_event_and_neighbors",
     "validate_event_expiries",
     "get_expiry_ranges",
@@ -70,13 +78,17 @@ __all__ = [
     "compute_spread_pct_atm",
     "compute_mom_betaadj",
     "compute_all_signals",
+    "compute_all_signals_batch",
     # Normalization and scoring (Dev Stage 7)
     "DirectionalScore",
     "DirectionalScorer",
     "IntradayScore",
     "normalize_today",
     "compute_dirscore",
+    "compute_dirscore_vectorized",
     "compute_scores_batch",
     "compute_intraday_dirscore",
+    "compute_intraday_dirscore_vectorized",
     "resolve_intraday_decision",
+    "resolve_intraday_decision_vectorized",
 ]
@@ -1,14 +1,44 @@
 """
 Event and expiry selection logic for earnings-based option strategies
 """
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict
+from typing import Callable, List, NamedTuple, Optional, Dict
+
+import numpy as np
+
+
+class EventExpiries(NamedTuple):
+    """
+    Event expiry and its neighbors for an earnings event
+    
+    Fields are read by attribute (``result.event``); string keys
+    (``result["event"]``, ``result.get("event")``) are also accepted so
+    callers written against the previous dict return keep working.
+    """
+    event: Optional[date] = None
+    prev: Optional[date] = None
+    next: Optional[date] = None
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default=None):
+        """Dict-style lookup by field name"""
+        if key in self._fields:
+            return getattr(self, key)
+        return default
 
 
 def find_event_and_neighbors(
     earnings_ts: datetime,
     expiries: List[date]
-) -> Dict[str, Optional[date]]:
+) -> EventExpiries:
     """
     Find the event expiry and its neighbors for an earnings event
     
@@ -23,12 +53,10 @@ def find_event_and_neighbors(
         expiries: List of available option expiration dates (sorted ascending)
     
     Returns:
-        Dict with keys:
-        {
-            "event": date or None,  # First expiry >= earnings date
-            "prev": date or None,   # Nearest expiry before event
-            "next": date or None    # Nearest expiry after event
-        }
+        EventExpiries with fields:
+            event: date or None  # First expiry >= earnings date
+            prev: date or None   # Nearest expiry before event
+            next: date or None   # Nearest expiry after event
     
     Examples:
         >>> from datetime import datetime, date
@@ -41,7 +69,7 @@ def find_event_and_neighbors(
         ... ]
         >>> result = find_event_and_neighbors(earnings, expiries)
         >>> result
-        {'event': date(2025, 11, 1), 'prev': date(2025, 10, 25), 'next': date(2025, 11, 15)}
+        EventExpiries(event=date(2025, 11, 1), prev=date(2025, 10, 25), next=date(2025, 11, 15))
     """
     # Convert earnings timestamp to date for comparison
     earnings_date = earnings_ts.date()
@@ -57,38 +85,19 @@ def find_event_and_neighbors(
     # Ensure expiries are sorted
     sorted_expiries = sorted(expiries)
     
-    # Initialize result
-    result = {
-        "event": None,
-        "prev": None,
-        "next": None
-    }
+    # Find the event expiry: first expiry >= earnings date
+    event_idx = bisect_left(sorted_expiries, earnings_date)
     
-    # Handle edge cases
-    if not sorted_expiries:
-        return result
+    # No event found (earnings after all expiries or no expiries at all)
+    if event_idx == len(sorted_expiries):
+        return EventExpiries()
     
-    # Find the event expiry: first expiry >= earnings date
-    event_idx = None
-    for i, expiry in enumerate(sorted_expiries):
-        if expiry >= earnings_date:
-            result["event"] = expiry
-            event_idx = i
-            break
-    
-    # If no event found (earnings after all expiries), return early
-    if event_idx is None:
-        return result
-    
-    # Find prev expiry: nearest expiry before event
-    if event_idx > 0:
-        result["prev"] = sorted_expiries[event_idx - 1]
-    
-    # Find next expiry: nearest expiry after event
-    if event_idx < len(sorted_expiries) - 1:
-        result["next"] = sorted_expiries[event_idx + 1]
-    
-    return result
+    # Prev is the nearest expiry before event, next the nearest after it
+    return EventExpiries(
+        event=sorted_expiries[event_idx],
+        prev=sorted_expiries[event_idx - 1] if event_idx > 0 else None,
+        next=sorted_expiries[event_idx + 1] if event_idx < len(sorted_expiries) - 1 else None
+    )
 
 
 def validate_event_expiries(
@@ -210,11 +219,63 @@ def get_expiry_ranges(
     return ranges
 
 
+def _to_datetime64(values: List[Optional[date]]) -> np.ndarray:
+    """Convert optional dates to a datetime64[D] array (None -> NaT)."""
+    return np.array(
+        [v if v is not None else "NaT" for v in values],
+        dtype="datetime64[D]"
+    )
+
+
+def _compute_dte_table(
+    earnings_dates: List[date],
+    events: List[Optional[date]],
+    prevs: List[Optional[date]],
+    nexts: List[Optional[date]]
+) -> List[Dict[str, Optional[int]]]:
+    """
+    Compute DTE metrics for a batch of events with a single array subtraction
+    
+    Args:
+        earnings_dates: Earnings date per event
+        events: Event expiry per event (None if missing)
+        prevs: Previous expiry per event (None if missing)
+        nexts: Next expiry per event (None if missing)
+    
+    Returns:
+        List of dicts with 'event', 'prev' and 'next' DTE values
+        (None where the underlying expiry is missing)
+    """
+    earnings_arr = _to_datetime64(earnings_dates)
+    event_arr = _to_datetime64(events)
+    prev_arr = _to_datetime64(prevs)
+    next_arr = _to_datetime64(nexts)
+    
+    columns = {
+        "event": event_arr - earnings_arr,
+        "prev": prev_arr - earnings_arr,
+        "next": next_arr - event_arr
+    }
+    
+    table = {}
+    for key, deltas in columns.items():
+        missing = np.isnat(deltas)
+        days = np.where(missing, 0, deltas.astype("timedelta64[D]").astype(np.int64))
+        table[key] = [None if m else int(d) for m, d in zip(missing, days)]
+    
+    return [
+        {"event": e, "prev": p, "next": n}
+        for e, p, n in zip(table["event"], table["prev"], table["next"])
+    ]
+
+
 def filter_expiries_around_earnings(
     earnings_events: List[Dict[str, any]],
     get_expiries_func,
     max_event_dte: int = 60,
-    require_neighbors: bool = False
+    require_neighbors: bool = False,
+    get_expiries_batch_func: Optional[Callable[[List[str]], Dict[str, List[date]]]] = None,
+    max_workers: int = 1
 ) -> List[Dict[str, any]]:
     """
     Process multiple earnings events and find valid expiries for each
@@ -226,6 +287,12 @@ def filter_expiries_around_earnings(
             Should have signature: get_expiries_func(symbol) -> List[date]
         max_event_dte: Maximum days to event expiry (default: 60)
         require_neighbors: If True, only include events with prev/next expiries
+        get_expiries_batch_func: Optional bulk lookup used instead of
+            get_expiries_func. Called once with the de-duplicated symbol list:
+            get_expiries_batch_func(symbols) -> {symbol: List[date]}
+        max_workers: Threads used to call get_expiries_func concurrently
+            (default: 1, sequential). Each symbol is fetched once; ignored when
+            get_expiries_batch_func is given.
     
     Returns:
         List of enriched earnings events:
@@ -234,11 +301,7 @@ def filter_expiries_around_earnings(
                 "symbol": str,
                 "earnings_ts": datetime,
                 "earnings_date": date,
-                "expiries": {
-                    "event": date,
-                    "prev": date or None,
-                    "next": date or None
-                },
+                "expiries": EventExpiries(event, prev, next),
                 "validation": {
                     "has_event": bool,
                     "has_prev": bool,
@@ -254,9 +317,24 @@ def filter_expiries_around_earnings(
             ...
         ]
         
-        Only includes events that pass validation.
+        Only includes events that pass validation. Output order follows
+        earnings_events regardless of max_workers.
     """
-    processed_events = []
+    symbols = list(dict.fromkeys(event["symbol"] for event in earnings_events))
+    
+    expiries_by_symbol = None
+    expiry_futures = None
+    if get_expiries_batch_func is not None:
+        expiries_by_symbol = get_expiries_batch_func(symbols) if symbols else {}
+    elif max_workers > 1 and len(symbols) > 1:
+        # Expiry lookups are network-bound; fetch them concurrently up front
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            expiry_futures = {
+                symbol: executor.submit(get_expiries_func, symbol)
+                for symbol in symbols
+            }
+    
+    candidates = []
     
     for event in earnings_events:
         symbol = event["symbol"]
@@ -265,7 +343,13 @@ def filter_expiries_around_earnings(
         
         try:
             # Get available expiries for this symbol
-            expiries = get_expiries_func(symbol)
+            if expiries_by_symbol is not None:
+                expiries = expiries_by_symbol.get(symbol)
+            elif expiry_futures is not None:
+                # Re-raises a failed lookup so it is reported below
+                expiries = expiry_futures[symbol].result()
+            else:
+                expiries = get_expiries_func(symbol)
             
             if not expiries:
                 print(f"Warning: No expiries found for {symbol}")
@@ -276,9 +360,9 @@ def filter_expiries_around_earnings(
             
             # Validate
             validation = validate_event_expiries(
-                expiry_dates["event"],
-                expiry_dates["prev"],
-                expiry_dates["next"],
+                expiry_dates.event,
+                expiry_dates.prev,
+                expiry_dates.next,
                 earnings_date,
                 max_event_dte=max_event_dte
             )
@@ -288,29 +372,33 @@ def filter_expiries_around_earnings(
                 continue
             
             # Skip if neighbors required but not available
-            if require_neighbors and (not expiry_dates["prev"] or not expiry_dates["next"]):
+            if require_neighbors and (not expiry_dates.prev or not expiry_dates.next):
                 continue
             
-            # Calculate DTE metrics
-            dte = {
-                "event": (expiry_dates["event"] - earnings_date).days if expiry_dates["event"] else None,
-                "prev": (expiry_dates["prev"] - earnings_date).days if expiry_dates["prev"] else None,
-                "next": (expiry_dates["next"] - expiry_dates["event"]).days if expiry_dates["next"] and expiry_dates["event"] else None
-            }
-            
-            # Add enriched event
-            processed_events.append({
+            candidates.append({
                 "symbol": symbol,
                 "earnings_ts": earnings_ts,
                 "earnings_date": earnings_date,
                 "expiries": expiry_dates,
-                "validation": validation,
-                "dte": dte
+                "validation": validation
             })
             
         except Exception as e:
             print(f"Error processing {symbol}: {e}")
             continue
     
-    return processed_events
-
+    if not candidates:
+        return []
+    
+    # Calculate DTE metrics for all events in one vectorized pass
+    dte_rows = _compute_dte_table(
+        [c["earnings_date"] for c in candidates],
+        [c["expiries"].event for c in candidates],
+        [c["expiries"].prev for c in candidates],
+        [c["expiries"].next for c in candidates]
+    )
+    
+    for candidate, dte in zip(candidates, dte_rows):
+        candidate["dte"] = dte
+    
+    return candidates
@@ -2,7 +2,9 @@
 Polygon.io API client for options data
 """
 import os
+import threading
 import requests
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime, date, timedelta
 from dotenv import load_dotenv
@@ -177,22 +179,39 @@ class PolygonClient:
         return all_results[:max_results]
 
 
-def get_expiries(symbol: str) -> List[date]:
+# Per-thread holder for the shared client; see get_default_client
+_thread_local = threading.local()
+
+
+def _default_client(api_key: Optional[str]) -> PolygonClient:
+    """Return this thread's shared client (and HTTP session) for api_key"""
+    client = getattr(_thread_local, "client", None)
+    if client is None or client.api_key != api_key:
+        new_client = PolygonClient(api_key=api_key)
+        if client is not None:
+            client.session.close()
+        client = _thread_local.client = new_client
+    return client
+
+
+def get_default_client() -> PolygonClient:
     """
-    Get all available expiration dates for a symbol's options
+    Get the shared PolygonClient used by the module-level helpers
     
-    Args:
-        symbol: Stock ticker symbol
+    Reusing one client keeps a single requests.Session alive, so repeated
+    calls share its connection pool instead of opening a new TLS connection
+    each time. requests.Session is not documented as thread-safe, so each
+    thread (e.g. IntradayJob or filter_expiries_around_earnings workers) gets
+    its own client and session.
     
     Returns:
-        List of expiration dates, sorted ascending
+        PolygonClient for the current POLYGON_API_KEY and thread
     """
-    client = PolygonClient()
-    
-    # Get all option contracts for this symbol
-    contracts = client.get_options_chain(underlying_ticker=symbol)
-    
-    # Extract unique expiration dates
+    return _default_client(os.getenv("POLYGON_API_KEY"))
+
+
+def _parse_expiries(contracts: List[Dict]) -> List[date]:
+    """Extract unique, sorted expiration dates from contract reference data."""
     expiries = set()
     for contract in contracts:
         exp_date = contract.get("expiration_date")
@@ -208,6 +227,73 @@ def get_expiries(symbol: str) -> List[date]:
     return sorted(list(expiries))
 
 
+def get_expiries(symbol: str) -> List[date]:
+    """
+    Get all available expiration dates for a symbol's options
+    
+    Args:
+        symbol: Stock ticker symbol
+    
+    Returns:
+        List of expiration dates, sorted ascending
+    """
+    client = get_default_client()
+    
+    # Get all option contracts for this symbol
+    contracts = client.get_options_chain(underlying_ticker=symbol)
+    
+    return _parse_expiries(contracts)
+
+
+def get_expiries_batch(symbols: List[str]) -> Dict[str, List[date]]:
+    """
+    Get expiration dates for many symbols in one pass
+    
+    Polygon's contracts endpoint is keyed by a single underlying, so this
+    de-duplicates the symbol list and issues one request per symbol over the
+    shared client session.
+    
+    Args:
+        symbols: List of stock ticker symbols (duplicates are fetched once)
+    
+    Returns:
+        Dict mapping symbol -> list of expiration dates, sorted ascending.
+        Symbols whose request fails map to an empty list.
+    """
+    client = get_default_client()
+    
+    expiries_by_symbol: Dict[str, List[date]] = {}
+    for symbol in dict.fromkeys(symbols):
+        try:
+            contracts = client.get_options_chain(underlying_ticker=symbol)
+        except Exception as e:
+            print(f"Warning: Could not fetch expiries for {symbol}: {e}")
+            expiries_by_symbol[symbol] = []
+            continue
+        expiries_by_symbol[symbol] = _parse_expiries(contracts)
+    
+    return expiries_by_symbol
+
+
+@lru_cache(maxsize=4096)
+def _expiries_to_fetch(start_expiry: date, end_expiry: date) -> tuple:
+    """
+    Expiry dates to request for a window: both endpoints plus every Friday
+    in between (weekly options), sorted ascending
+    
+    Cached because many earnings events in a batch share the same window.
+    """
+    expiries = {start_expiry, end_expiry}
+    
+    # First Friday on or after start, then step a week at a time
+    current = start_expiry + timedelta(days=(4 - start_expiry.weekday()) % 7)
+    while current <= end_expiry:
+        expiries.add(current)
+        current += timedelta(days=7)
+    
+    return tuple(sorted(expiries))
+
+
 def get_chain_snapshot(
     symbol: str,
     start_expiry: date,
@@ -246,7 +332,7 @@ def get_chain_snapshot(
             ...
         }
     """
-    client = PolygonClient()
+    client = get_default_client()
     
     # If start and end are the same, fetch single expiry
     if start_expiry == end_expiry:
@@ -264,20 +350,8 @@ def get_chain_snapshot(
     # For multiple expiries, fetch each separately and combine
     all_contracts = []
     
-    # Build list of unique expiry dates to fetch
-    expiries_to_fetch = set()
-    expiries_to_fetch.add(start_expiry)
-    expiries_to_fetch.add(end_expiry)
-    
-    # Also check for any Friday dates in between (weekly options)
-    current = start_expiry
-    while current <= end_expiry:
-        if current.weekday() == 4:  # Friday
-            expiries_to_fetch.add(current)
-        current += timedelta(days=1)
-    
     # Fetch contracts for each unique expiry
-    for expiry in sorted(expiries_to_fetch):
+    for expiry in _expiries_to_fetch(start_expiry, end_expiry):
         try:
             contracts = client.get_snapshot_paginated(
                 underlying_ticker=symbol,
@@ -327,7 +401,7 @@ def get_underlying_agg(
             ...
         ]
     """
-    client = PolygonClient()
+    client = get_default_client()
     
     # Convert dates to required format
     start_str = start.strftime("%Y-%m-%d")
@@ -384,7 +458,7 @@ def get_option_daily_oc(
             "implied_volatility": 0.25
         }
     """
-    client = PolygonClient()
+    client = get_default_client()
     
     # Build URL for daily open/close endpoint
     date_str = date.strftime("%Y-%m-%d")
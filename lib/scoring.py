@@ -6,10 +6,10 @@ Dev Stage 7 - Normalization & Scoring
 """
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from scipy import stats
 
 
 @dataclass
@@ -259,54 +259,161 @@ class DirectionalScorer:
         )
 
 
+# Normalized columns read by the DirScore kernel
+_DIRSCORE_INPUTS = (
+    'z_rr_25d', 'z_delta_oi_net', 'z_net_thrust', 'z_call_thrust',
+    'z_put_thrust', 'z_vol_pcr', 'z_beta_adj_return', 'pct_iv_bump',
+    'z_spread_pct_atm'
+)
+
+# Component order for the weight vectors below
+_WEIGHT_KEYS = ('d1', 'd2', 'd3', 'd4', 'p1', 'p2')
+
+# Dev Stage 7 DirScore weights (d3 applies to the negated PCR z-score)
+_DIRSCORE_WEIGHTS = np.array([0.32, 0.28, 0.18, 0.12, -0.10, -0.05])
+
+# Intraday nowcast weights (d3 applies to the raw PCR z-score)
+_INTRADAY_WEIGHTS = np.array([0.38, 0.28, -0.18, 0.10, -0.10, -0.05])
+
+# |DirScore| at or above which compute_dirscore commits to CALL/PUT
+_DECISION_THRESHOLD = 0.6
+
+
+def _weight_vector(
+    weights: Optional[Dict[str, float]],
+    default: np.ndarray
+) -> np.ndarray:
+    """Return weights as a vector in _WEIGHT_KEYS order (default if None)."""
+    if weights is None:
+        return default
+    return np.array([weights[key] for key in _WEIGHT_KEYS], dtype=np.float64)
+
+
+def _value_or(values: Mapping, key: str, default: float) -> float:
+    """Return values[key], or default when the key is missing or NaN."""
+    value = values.get(key)
+    return default if pd.isna(value) else value
+
+
+def _column_or(
+    data: Union[pd.DataFrame, Mapping[str, np.ndarray]],
+    column: str,
+    default: float,
+    n_rows: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Return a float column with NaN (or a missing column) replaced by default.
+
+    ``data`` is a DataFrame or a mapping of column arrays; ``n_rows`` sizes a
+    missing column and defaults to ``len(data)``, so pass it for mappings.
+    """
+    if column not in data:
+        return np.full(len(data) if n_rows is None else n_rows, default, dtype=np.float64)
+    values = np.asarray(pd.to_numeric(data[column], errors="coerce"), dtype=np.float64)
+    return np.where(np.isnan(values), default, values)
+
+
 # ============================================================================
 # Intraday scoring helpers (Method.md intraday playbook)
 # ============================================================================
 
 
 def compute_intraday_dirscore(
-    row: pd.Series,
+    row: Union[pd.Series, Mapping],
     weights: Optional[Dict[str, float]] = None,
 ) -> Tuple[float, str]:
     """Compute intraday directional score using nowcast weights."""
 
-    if weights is None:
-        weights = {
-            "d1": 0.38,
-            "d2": 0.28,
-            "d3": -0.18,
-            "d4": 0.10,
-            "p1": -0.10,
-            "p2": -0.05,
-        }
-
-    d1 = row.get("z_rr_25d", 0.0)
-    d2 = row.get("z_net_thrust", 0.0)
-    d3 = row.get("z_vol_pcr", 0.0)
-    d4 = row.get("z_beta_adj_return", 0.0)
-    p1 = row.get("pct_iv_bump", 0.5)
-    p2 = row.get("z_spread_pct_atm", 0.0)
-
-    d1 = 0.0 if pd.isna(d1) else d1
-    d2 = 0.0 if pd.isna(d2) else d2
-    d3 = 0.0 if pd.isna(d3) else d3
-    d4 = 0.0 if pd.isna(d4) else d4
-    p1 = 0.5 if pd.isna(p1) else p1
-    p2 = 0.0 if pd.isna(p2) else p2
-
-    score = (
-        weights["d1"] * d1
-        + weights["d2"] * d2
-        + weights["d3"] * d3
-        + weights["d4"] * d4
-        + weights["p1"] * p1
-        + weights["p2"] * p2
-    )
+    w = _weight_vector(weights, _INTRADAY_WEIGHTS)
+
+    values = row if isinstance(row, Mapping) else row.to_dict()
+
+    d1 = _value_or(values, "z_rr_25d", 0.0)
+    d2 = _value_or(values, "z_net_thrust", 0.0)
+    d3 = _value_or(values, "z_vol_pcr", 0.0)
+    d4 = _value_or(values, "z_beta_adj_return", 0.0)
+    p1 = _value_or(values, "pct_iv_bump", 0.5)
+    p2 = _value_or(values, "z_spread_pct_atm", 0.0)
+
+    score = float(w @ np.array([d1, d2, d3, d4, p1, p2], dtype=np.float64))
 
     direction = "CALL" if score >= 0 else "PUT"
     return score, direction
 
 
+def compute_intraday_dirscore_vectorized(
+    df: pd.DataFrame,
+    weights: Optional[Dict[str, float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Column-wise compute_intraday_dirscore: returns (scores, directions) arrays."""
+
+    components = np.column_stack([
+        _column_or(df, "z_rr_25d", 0.0),
+        _column_or(df, "z_net_thrust", 0.0),
+        _column_or(df, "z_vol_pcr", 0.0),
+        _column_or(df, "z_beta_adj_return", 0.0),
+        _column_or(df, "pct_iv_bump", 0.5),
+        _column_or(df, "z_spread_pct_atm", 0.0),
+    ])
+    scores = components @ _weight_vector(weights, _INTRADAY_WEIGHTS)
+
+    directions = np.where(scores >= 0, "CALL", "PUT")
+    return scores, directions
+
+
+# Guardrail thresholds for intraday decisions
+_MIN_TOTAL_VOLUME = 10
+_MAX_SPREAD_PCT = 10
+_IV_RICH_PCT = 0.80
+
+# |score| band edges: [0, 0.40) pass, [0.40, 0.60) vertical, >= 0.60 naked
+_SCORE_BINS = np.array([0.40, 0.60])
+
+# Structure indexed by [score band, rich IV]; rich IV caps naked at vertical
+_STRUCTURE_TABLE = np.array([
+    ["SKIP", "SKIP"],
+    ["VERTICAL", "VERTICAL"],
+    ["NAKED", "VERTICAL"],
+])
+
+
+def resolve_intraday_decision_vectorized(
+    scores,
+    pct_iv_bump,
+    spread_pct,
+    total_volume,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise resolve_intraday_decision via band lookup instead of branches.
+
+    Args:
+        scores: Intraday DirScores
+        pct_iv_bump: IV bump percentiles (NaN/None skips the IV guard)
+        spread_pct: ATM spread percentages (NaN/None skips the spread guard)
+        total_volume: Total option volume (NaN/None skips the volume guard)
+
+    Returns:
+        Tuple of (decisions, structures) arrays
+    """
+    scores = np.atleast_1d(np.asarray(scores, dtype=np.float64))
+    pct_iv_bump = np.asarray(pct_iv_bump, dtype=np.float64)
+    spread_pct = np.asarray(spread_pct, dtype=np.float64)
+    total_volume = np.asarray(total_volume, dtype=np.float64)
+
+    # NaN comparisons are False, so missing inputs never trip a guard
+    band = np.searchsorted(_SCORE_BINS, np.abs(scores), side='right')
+    skip = (
+        (total_volume < _MIN_TOTAL_VOLUME)
+        | (spread_pct > _MAX_SPREAD_PCT)
+        | (band == 0)
+    )
+    iv_rich = np.broadcast_to(pct_iv_bump >= _IV_RICH_PCT, scores.shape)
+
+    structures = np.where(skip, "SKIP", _STRUCTURE_TABLE[band, iv_rich.astype(int)])
+    decisions = np.where(skip, "PASS", np.where(scores >= 0, "CALL", "PUT"))
+    return decisions, structures
+
+
 def resolve_intraday_decision(
     score: float,
     pct_iv_bump: Optional[float],
@@ -315,37 +422,33 @@ def resolve_intraday_decision(
 ) -> Tuple[str, str]:
     """Determine decision/structure for intraday scores with guardrails."""
 
-    if total_volume is not None and not pd.isna(total_volume):
-        if total_volume < 10:
-            return "PASS", "SKIP"
-
-    if spread_pct is not None and not pd.isna(spread_pct):
-        if spread_pct > 10:
-            return "PASS", "SKIP"
-
-    abs_score = abs(score)
-    if abs_score < 0.40:
-        return "PASS", "SKIP"
+    decisions, structures = resolve_intraday_decision_vectorized(
+        score, pct_iv_bump, spread_pct, total_volume
+    )
+    return str(decisions[0]), str(structures[0])
 
-    direction = "CALL" if score >= 0 else "PUT"
 
-    if abs_score < 0.60:
-        decision = direction
-        structure = "VERTICAL"
-    else:
-        decision = direction
-        structure = "NAKED"
+# ============================================================================
+# Dev Stage 7 - Normalization & Scoring Functions
+# ============================================================================
 
-    if pct_iv_bump is not None and not pd.isna(pct_iv_bump):
-        if pct_iv_bump >= 0.80:
-            structure = "VERTICAL"
 
-    return decision, structure
+# Metadata columns never treated as signals by normalize_today auto-detection
+_NON_SIGNAL_COLUMNS = frozenset({
+    'symbol', 'ticker', 'date', 'earnings_date', 'event_date',
+    'expiry', 'expiration_date'
+})
 
 
-# ============================================================================
-# Dev Stage 7 - Normalization & Scoring Functions
-# ============================================================================
+@lru_cache(maxsize=64)
+def _detect_signal_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Auto-detect signal columns (exclude metadata and derived z_/pct_ columns)"""
+    return tuple(
+        col for col in columns
+        if col not in _NON_SIGNAL_COLUMNS
+        and not col.startswith('z_')
+        and not col.startswith('pct_')
+    )
 
 
 def normalize_today(
@@ -376,62 +479,72 @@ def normalize_today(
         >>> df_norm = normalize_today(df)
         >>> # Now has z_rr_25d, pct_rr_25d, z_vol_pcr, pct_vol_pcr, etc.
     """
+    normalized = _normalized_columns(df, signal_columns, winsorize_std)
+    return df.assign(**normalized)
+
+
+def _normalize_matrix(
+    values: np.ndarray,
+    winsorize_std: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Winsorized z-scores and percentile ranks for a rows x signals matrix
+    
+    Returns:
+        Tuple of (z_scores, percentiles) with the same shape as values
+    """
+    # NaN-skipping column mean and sample std in one pass
+    matrix = pd.DataFrame(values)
+    counts = matrix.count().to_numpy()
+    mean = matrix.mean().to_numpy()
+    std = matrix.std().to_numpy()
+    
+    # Z-scores winsorized to ±winsorize_std; no variance -> all 0. Constant
+    # columns are detected by range so float noise in std cannot blow them up
+    no_variance = (
+        (matrix.max().to_numpy() == matrix.min().to_numpy())
+        | (std == 0)
+        | np.isnan(std)
+    )
+    safe_std = np.where(no_variance, 1.0, std)
+    z_scores = np.clip((values - mean) / safe_std, -winsorize_std, winsorize_std)
+    z_scores = np.where(no_variance, 0.0, z_scores)
+    
+    # All-NaN signals stay NaN
+    z_scores[:, counts == 0] = np.nan
+    
+    # Percentiles (0-1 scale), average rank for ties; NaN stays NaN
+    percentiles = matrix.rank(pct=True, method='average').to_numpy()
+    
+    return z_scores, percentiles
+
+
+def _normalized_columns(
+    df: pd.DataFrame,
+    signal_columns: Optional[List[str]],
+    winsorize_std: float
+) -> Dict[str, np.ndarray]:
+    """Return {z_<col>: ..., pct_<col>: ...} arrays for each signal column in df."""
     if signal_columns is None:
-        # Auto-detect signal columns (exclude metadata columns)
-        exclude_cols = {
-            'symbol', 'ticker', 'date', 'earnings_date', 'event_date',
-            'expiry', 'expiration_date'
-        }
-        signal_columns = [
-            col for col in df.columns
-            if col not in exclude_cols
-            and not col.startswith('z_')
-            and not col.startswith('pct_')
-        ]
-    
-    df_norm = df.copy()
-    
-    for col in signal_columns:
-        if col not in df.columns:
-            continue
-        
-        # Skip if all NaN
-        if df[col].isna().all():
-            df_norm[f'z_{col}'] = np.nan
-            df_norm[f'pct_{col}'] = np.nan
-            continue
-        
-        # Get non-NaN values
-        values = df[col].dropna()
-        
-        if len(values) == 0:
-            df_norm[f'z_{col}'] = np.nan
-            df_norm[f'pct_{col}'] = np.nan
-            continue
-        
-        # Compute z-scores
-        mean = values.mean()
-        std = values.std()
-        
-        if std == 0 or np.isnan(std):
-            # No variance, set all to 0
-            df_norm[f'z_{col}'] = 0.0
-        else:
-            z_scores = (df[col] - mean) / std
-            # Winsorize to ±winsorize_std
-            z_scores = z_scores.clip(-winsorize_std, winsorize_std)
-            df_norm[f'z_{col}'] = z_scores
-        
-        # Compute percentiles (0-1 scale)
-        # Use rank with method='average' to handle ties
-        percentiles = df[col].rank(pct=True, method='average')
-        df_norm[f'pct_{col}'] = percentiles
+        signal_columns = list(_detect_signal_columns(tuple(df.columns)))
     
-    return df_norm
+    columns = [col for col in signal_columns if col in df.columns]
+    if not columns:
+        return {}
+    
+    z_scores, percentiles = _normalize_matrix(
+        df[columns].to_numpy(dtype=np.float64), winsorize_std
+    )
+    
+    normalized = {}
+    for i, col in enumerate(columns):
+        normalized[f'z_{col}'] = z_scores[:, i]
+        normalized[f'pct_{col}'] = percentiles[:, i]
+    return normalized
 
 
 def compute_dirscore(
-    row: pd.Series,
+    row: Union[pd.Series, Mapping],
     weights: Optional[Dict[str, float]] = None
 ) -> Tuple[float, str]:
     """
@@ -451,7 +564,7 @@ def compute_dirscore(
     - otherwise: PASS_OR_SPREAD
     
     Args:
-        row: Series with normalized signals (z_* and pct_* columns)
+        row: Series or dict with normalized signals (z_* and pct_* columns)
         weights: Optional custom weights dict
     
     Returns:
@@ -464,59 +577,45 @@ def compute_dirscore(
         ...     axis=1
         ... )
     """
-    if weights is None:
-        weights = {
-            'd1': 0.32,   # RR 25Δ
-            'd2': 0.28,   # Vol imbalance
-            'd3': 0.18,   # PCR (inverted)
-            'd4': 0.12,   # Momentum
-            'p1': -0.10,  # IV bump
-            'p2': -0.05,  # Spread
-        }
+    w = _weight_vector(weights, _DIRSCORE_WEIGHTS)
+    
+    # Read the row once as a plain dict; Series.get is much slower per key
+    values = row if isinstance(row, Mapping) else row.to_dict()
     
     # Extract components (with defaults to 0 if missing)
-    d1 = row.get('z_rr_25d', 0.0) if not pd.isna(row.get('z_rr_25d')) else 0.0
+    d1 = _value_or(values, 'z_rr_25d', 0.0)
     
     # D2: Flow imbalance combining ΔOI and ΔVol
-    z_oi = row.get('z_delta_oi_net', 0.0) if not pd.isna(row.get('z_delta_oi_net')) else 0.0
-
-    if 'z_net_thrust' in row and not pd.isna(row.get('z_net_thrust')):
-        z_vol = row['z_net_thrust']
-    elif 'z_call_thrust' in row and 'z_put_thrust' in row:
-        call_thrust = row.get('z_call_thrust', 0.0) if not pd.isna(row.get('z_call_thrust')) else 0.0
-        put_thrust = row.get('z_put_thrust', 0.0) if not pd.isna(row.get('z_put_thrust')) else 0.0
-        z_vol = call_thrust - put_thrust
+    z_oi = _value_or(values, 'z_delta_oi_net', 0.0)
+
+    if not pd.isna(values.get('z_net_thrust')):
+        z_vol = values['z_net_thrust']
+    elif 'z_call_thrust' in values and 'z_put_thrust' in values:
+        z_vol = _value_or(values, 'z_call_thrust', 0.0) - _value_or(values, 'z_put_thrust', 0.0)
     else:
         z_vol = 0.0
 
     d2 = z_oi + 0.5 * z_vol
     
     # D3: PCR (lower PCR is bullish, so we negate)
-    d3 = -row.get('z_vol_pcr', 0.0) if not pd.isna(row.get('z_vol_pcr')) else 0.0
+    d3 = -_value_or(values, 'z_vol_pcr', 0.0)
     
     # D4: Beta-adjusted momentum
-    d4 = row.get('z_beta_adj_return', 0.0) if not pd.isna(row.get('z_beta_adj_return')) else 0.0
+    d4 = _value_or(values, 'z_beta_adj_return', 0.0)
     
     # P1: IV bump (use percentile, 0-1 scale)
-    p1 = row.get('pct_iv_bump', 0.5) if not pd.isna(row.get('pct_iv_bump')) else 0.5
+    p1 = _value_or(values, 'pct_iv_bump', 0.5)
     
     # P2: Spread
-    p2 = row.get('z_spread_pct_atm', 0.0) if not pd.isna(row.get('z_spread_pct_atm')) else 0.0
+    p2 = _value_or(values, 'z_spread_pct_atm', 0.0)
     
     # Compute weighted score
-    score = (
-        weights['d1'] * d1 +
-        weights['d2'] * d2 +
-        weights['d3'] * d3 +
-        weights['d4'] * d4 +
-        weights['p1'] * p1 +
-        weights['p2'] * p2
-    )
+    score = float(w @ np.array([d1, d2, d3, d4, p1, p2], dtype=np.float64))
     
     # Determine decision
-    if score >= 0.6:
+    if score >= _DECISION_THRESHOLD:
         decision = "CALL"
-    elif score <= -0.6:
+    elif score <= -_DECISION_THRESHOLD:
         decision = "PUT"
     else:
         decision = "PASS_OR_SPREAD"
@@ -524,22 +623,98 @@ def compute_dirscore(
     return score, decision
 
 
+def compute_dirscore_vectorized(
+    df: pd.DataFrame,
+    weights: Optional[Dict[str, float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute directional scores and decisions for every row at once
+    
+    Column-wise equivalent of applying compute_dirscore to each row: same
+    weights, NaN defaults, net-thrust fallback and decision thresholds.
+    
+    Args:
+        df: DataFrame with normalized signals (z_* and pct_* columns)
+        weights: Optional custom weights dict
+    
+    Returns:
+        Tuple of (scores, decisions) arrays aligned with df rows
+    
+    Example:
+        >>> df_norm = normalize_today(df)
+        >>> df_norm['score'], df_norm['decision'] = compute_dirscore_vectorized(df_norm)
+    """
+    columns = {
+        col: pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64)
+        for col in _DIRSCORE_INPUTS
+        if col in df.columns
+    }
+    return _dirscore_arrays(columns, len(df), weights)
+
+
+def _dirscore_arrays(
+    columns: Mapping[str, np.ndarray],
+    n_rows: int,
+    weights: Optional[Dict[str, float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score kernel behind compute_dirscore_vectorized, over float arrays by name."""
+    w = _weight_vector(weights, _DIRSCORE_WEIGHTS)
+    
+    d1 = _column_or(columns, 'z_rr_25d', 0.0, n_rows)
+    
+    # D2: Flow imbalance; fall back to call - put thrust where net thrust is missing
+    if 'z_call_thrust' in columns and 'z_put_thrust' in columns:
+        z_vol = (
+            _column_or(columns, 'z_call_thrust', 0.0, n_rows)
+            - _column_or(columns, 'z_put_thrust', 0.0, n_rows)
+        )
+    else:
+        z_vol = np.zeros(n_rows, dtype=np.float64)
+    if 'z_net_thrust' in columns:
+        net_thrust = columns['z_net_thrust']
+        z_vol = np.where(np.isnan(net_thrust), z_vol, net_thrust)
+    d2 = _column_or(columns, 'z_delta_oi_net', 0.0, n_rows) + 0.5 * z_vol
+    
+    d3 = -_column_or(columns, 'z_vol_pcr', 0.0, n_rows)
+    d4 = _column_or(columns, 'z_beta_adj_return', 0.0, n_rows)
+    p1 = _column_or(columns, 'pct_iv_bump', 0.5, n_rows)
+    p2 = _column_or(columns, 'z_spread_pct_atm', 0.0, n_rows)
+    
+    scores = np.column_stack([d1, d2, d3, d4, p1, p2]) @ w
+    return scores, _classify_scores(scores)
+
+
+def _classify_scores(scores: np.ndarray) -> np.ndarray:
+    """Branch-free compute_dirscore decision for an array of scores."""
+    return np.select(
+        [scores >= _DECISION_THRESHOLD, scores <= -_DECISION_THRESHOLD],
+        ["CALL", "PUT"],
+        default="PASS_OR_SPREAD"
+    )
+
+
 def compute_scores_batch(
     df: pd.DataFrame,
     signal_columns: Optional[List[str]] = None,
     winsorize_std: float = 2.0,
-    weights: Optional[Dict[str, float]] = None
+    weights: Optional[Dict[str, float]] = None,
+    prenormalized: bool = False
 ) -> pd.DataFrame:
     """
     Convenience function to normalize and score a batch of events
     
-    Combines normalize_today and compute_dirscore in one step
+    Combines normalize_today and compute_dirscore in one step; scores are
+    computed from the normalized arrays before they are attached to the frame.
+    Pass prenormalized=True to score a frame whose z_/pct_ columns an earlier
+    stage already computed (e.g. re-scoring normalize_today output) without
+    normalizing again.
     
     Args:
-        df: DataFrame with raw signals
+        df: DataFrame with raw or already-normalized signals
         signal_columns: List of columns to normalize
         winsorize_std: Standard deviations for winsorization
         weights: Optional custom weights for scoring
+        prenormalized: Score the existing z_/pct_ columns as-is
     
     Returns:
         DataFrame with normalized signals, scores, and decisions
@@ -549,16 +724,21 @@ def compute_scores_batch(
         >>> df_scored = compute_scores_batch(df)
         >>> print(df_scored[['symbol', 'score', 'decision']].head())
     """
-    # Normalize
-    df_norm = normalize_today(df, signal_columns, winsorize_std)
-    
-    # Compute scores
-    scores_and_decisions = df_norm.apply(
-        lambda row: pd.Series(compute_dirscore(row, weights)),
-        axis=1
-    )
-    
-    df_norm['score'] = scores_and_decisions[0]
-    df_norm['decision'] = scores_and_decisions[1]
-    
-    return df_norm
+    # Normalize, keeping the z/pct arrays to score from directly; skip the
+    # pass only when the caller says the frame is already normalized
+    if prenormalized:
+        normalized = {}
+    else:
+        normalized = _normalized_columns(df, signal_columns, winsorize_std)
+    
+    # Score inputs: freshly normalized arrays, else pre-existing columns
+    columns = {}
+    for col in _DIRSCORE_INPUTS:
+        if col in normalized:
+            columns[col] = normalized[col]
+        elif col in df.columns:
+            columns[col] = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64)
+    scores, decisions = _dirscore_arrays(columns, len(df), weights)
+    
+    # Attach everything in a single assign
+    return df.assign(**normalized, score=scores, decision=decisions)
@@ -6,7 +6,6 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Tuple
 from datetime import date, timedelta
-from scipy import interpolate
 
 
 def interp_iv_at_delta(
@@ -30,49 +29,64 @@ def interp_iv_at_delta(
         >>> iv_25d_call = interp_iv_at_delta(contracts, target_delta=0.25, side="call")
         >>> iv_25d_put = interp_iv_at_delta(contracts, target_delta=0.25, side="put")
     """
-    # Filter contracts by side
-    side_contracts = [
-        c for c in contracts
-        if c.get("details", {}).get("contract_type", "").lower() == side.lower()
-    ]
-    
-    if not side_contracts:
-        return None
+    soa = _contracts_to_soa(contracts)
+    side = side.lower()
+    if side in ("call", "put"):
+        side_mask = soa[f'is_{side}']
+    else:
+        side_mask = np.array([
+            c.get("details", {}).get("contract_type", "").lower() == side
+            for c in contracts
+        ], dtype=bool)
     
-    # Extract delta and IV pairs
-    delta_iv_pairs = []
-    for contract in side_contracts:
-        greeks = contract.get("greeks", {})
-        delta = greeks.get("delta")
-        iv = contract.get("implied_volatility")
-        
-        if delta is not None and iv is not None and iv > 0:
-            # Use absolute delta for comparison
-            abs_delta = abs(delta)
-            delta_iv_pairs.append((abs_delta, iv))
+    return _iv_at_delta(soa, side_mask, target_delta)
+
+
+def _iv_at_delta(soa: np.ndarray, side_mask: np.ndarray, target_delta: float) -> Optional[float]:
+    """
+    Interpolate IV at |delta| = target_delta over the contracts in side_mask
     
-    if len(delta_iv_pairs) < 2:
+    Contracts missing delta or IV, or with non-positive IV, are dropped.
+    """
+    valid = side_mask & ~np.isnan(soa['delta']) & (soa['iv'] > 0)
+    if np.count_nonzero(valid) < 2:
         return None
     
-    # Sort by delta
-    delta_iv_pairs.sort(key=lambda x: x[0])
-    
-    # Extract arrays
-    deltas = np.array([d for d, _ in delta_iv_pairs])
-    ivs = np.array([iv for _, iv in delta_iv_pairs])
-    
-    # Check if target_delta is within range
-    if target_delta < deltas.min() or target_delta > deltas.max():
-        # If target is outside range, use linear extrapolation (carefully)
-        # or return nearest value
-        if target_delta < deltas.min():
-            return ivs[0]
-        else:
-            return ivs[-1]
+    return _interp_clamped(np.abs(soa['delta'][valid]), soa['iv'][valid], target_delta)
+
+
+def _interp_clamped(x: np.ndarray, y: np.ndarray, target: float) -> float:
+    """Linear interpolation of y at target, returning the nearest edge value outside x"""
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    
+    # One binary search gives both the clamp decision and the bracket
+    idx = int(np.searchsorted(x, target))
+    if idx == 0 and target < x[0]:
+        return float(y[0])
+    if idx == len(x):
+        return float(y[-1])
+    return _interp_segment(x, y, target, idx)
+
+
+def _interp_segment(
+    x: np.ndarray,
+    y: np.ndarray,
+    target: float,
+    idx: Optional[int] = None
+) -> float:
+    """
+    Linear interpolation on sorted x, extending the end segments outside x
     
-    # Interpolate using linear interpolation
-    interp_func = interpolate.interp1d(deltas, ivs, kind='linear', fill_value='extrapolate')
-    return float(interp_func(target_delta))
+    Brackets like scipy's interp1d: duplicate x resolve to the segment ending
+    at their first occurrence. ``idx`` is a precomputed left searchsorted
+    position of target in x.
+    """
+    if idx is None:
+        idx = int(np.searchsorted(x, target))
+    hi = min(max(idx, 1), len(x) - 1)
+    lo = hi - 1
+    return float(y[lo] + (target - x[lo]) * (y[hi] - y[lo]) / (x[hi] - x[lo]))
 
 
 def atm_iv(contracts: List[Dict], spot_price: Optional[float] = None) -> Optional[float]:
@@ -95,79 +109,115 @@ def atm_iv(contracts: List[Dict], spot_price: Optional[float] = None) -> Optiona
     
     # Extract spot price if not provided
     if spot_price is None:
-        # Try to get from contract data
-        for contract in contracts:
-            underlying_price = contract.get("underlying_asset", {}).get("price")
-            if underlying_price:
-                spot_price = underlying_price
-                break
-        
+        spot_price = _extract_spot(contracts)
         if spot_price is None:
             return None
     
-    # Get calls and puts near ATM
-    call_strikes = []
-    call_ivs = []
-    put_strikes = []
-    put_ivs = []
-    
+    return _atm_iv_soa(_contracts_to_soa(contracts), spot_price)
+
+
+def _extract_spot(contracts: List[Dict]) -> Optional[float]:
+    """First non-zero underlying price in the chain, or None"""
     for contract in contracts:
-        details = contract.get("details", {})
-        strike = details.get("strike_price")
-        contract_type = details.get("contract_type", "").lower()
-        iv = contract.get("implied_volatility")
-        
-        if strike is None or iv is None or iv <= 0:
-            continue
-        
-        # Only use strikes within ±20% of spot
-        if abs(strike - spot_price) / spot_price > 0.2:
-            continue
-        
-        if contract_type == "call":
-            call_strikes.append(strike)
-            call_ivs.append(iv)
-        elif contract_type == "put":
-            put_strikes.append(strike)
-            put_ivs.append(iv)
+        underlying_price = contract.get("underlying_asset", {}).get("price")
+        if underlying_price:
+            return underlying_price
+    return None
+
+
+def _atm_iv_soa(soa: np.ndarray, spot_price: float) -> Optional[float]:
+    """atm_iv over a contract array with a known spot price"""
+    strikes, ivs = soa['strike'], soa['iv']
+    
+    # Only use valid quotes on strikes within ±20% of spot
+    near = (
+        ~np.isnan(strikes)
+        & (ivs > 0)
+        & (np.abs(strikes - spot_price) / spot_price <= 0.2)
+    )
+    call_idx = np.flatnonzero(near & soa['is_call'])
+    put_idx = np.flatnonzero(near & soa['is_put'])
     
     # Need at least 2 points for interpolation
-    if len(call_strikes) < 2 or len(put_strikes) < 2:
-        # Fall back to any available ATM contracts
-        all_strikes = call_strikes + put_strikes
-        all_ivs = call_ivs + put_ivs
-        if not all_strikes:
+    if len(call_idx) < 2 or len(put_idx) < 2:
+        # Fall back to any available ATM contracts (calls take ties)
+        all_idx = np.concatenate([call_idx, put_idx])
+        if not len(all_idx):
             return None
         
         # Find closest strike to spot
-        closest_idx = np.argmin([abs(s - spot_price) for s in all_strikes])
-        return all_ivs[closest_idx]
-    
-    # Interpolate for calls
-    call_strikes = np.array(call_strikes)
-    call_ivs = np.array(call_ivs)
-    sorted_call_idx = np.argsort(call_strikes)
-    call_strikes = call_strikes[sorted_call_idx]
-    call_ivs = call_ivs[sorted_call_idx]
-    
-    # Interpolate for puts
-    put_strikes = np.array(put_strikes)
-    put_ivs = np.array(put_ivs)
-    sorted_put_idx = np.argsort(put_strikes)
-    put_strikes = put_strikes[sorted_put_idx]
-    put_ivs = put_ivs[sorted_put_idx]
-    
-    # Interpolate at spot
-    call_interp = interpolate.interp1d(call_strikes, call_ivs, kind='linear', fill_value='extrapolate')
-    put_interp = interpolate.interp1d(put_strikes, put_ivs, kind='linear', fill_value='extrapolate')
-    
-    call_atm_iv = float(call_interp(spot_price))
-    put_atm_iv = float(put_interp(spot_price))
-    
-    # Average call and put ATM IV
+        closest = all_idx[np.argmin(np.abs(strikes[all_idx] - spot_price))]
+        return float(ivs[closest])
+    
+    # Interpolate each side at spot and average
+    call_atm_iv = _interp_extrapolated(strikes[call_idx], ivs[call_idx], spot_price)
+    put_atm_iv = _interp_extrapolated(strikes[put_idx], ivs[put_idx], spot_price)
     return (call_atm_iv + put_atm_iv) / 2.0
 
 
+# One record per contract; missing numeric fields are NaN
+_CONTRACT_DTYPE = np.dtype([
+    ('is_call', '?'),
+    ('is_put', '?'),
+    ('strike', 'f8'),
+    ('iv', 'f8'),
+    ('delta', 'f8'),
+    ('vol', 'f8'),
+    ('price', 'f8'),
+    ('bid', 'f8'),
+    ('ask', 'f8'),
+])
+
+
+# Shared default for missing sub-dicts; only ever read
+_EMPTY: Dict = {}
+
+
+def _contract_rows(contracts: List[Dict]):
+    """Yield one _CONTRACT_DTYPE tuple per contract"""
+    empty = _EMPTY
+    for contract in contracts:
+        details = contract.get("details", empty)
+        contract_type = details.get("contract_type", "").lower()
+        strike = details.get("strike_price")
+        if strike is None:
+            strike = details.get("strike")
+        day = contract.get("day", empty)
+        last_quote = contract.get("last_quote", empty)
+        yield (
+            contract_type == "call",
+            contract_type == "put",
+            strike,
+            contract.get("implied_volatility"),
+            contract.get("greeks", empty).get("delta"),
+            day.get("volume", 0) or 0,
+            contract.get("last_trade", empty).get("price") or day.get("close"),
+            last_quote.get("bid"),
+            last_quote.get("ask"),
+        )
+
+
+def _contracts_to_soa(contracts: List[Dict]) -> np.ndarray:
+    """
+    Flatten contracts into a structured array with one field per column
+    
+    Accepts both ``strike_price`` and the legacy ``strike`` detail key.
+    ``vol`` is the day volume (0 if missing) and ``price`` the last trade,
+    falling back to the day close.
+    """
+    # Rows stream straight into a preallocated array; None converts to NaN
+    # for the float fields
+    return np.fromiter(
+        _contract_rows(contracts), dtype=_CONTRACT_DTYPE, count=len(contracts)
+    )
+
+
+def _interp_extrapolated(x: np.ndarray, y: np.ndarray, target: float) -> float:
+    """Linear interpolation of y at target, extending the end segments outside x"""
+    order = np.argsort(x)
+    return _interp_segment(x[order], y[order], target)
+
+
 def compute_rr_25d(event_contracts: List[Dict]) -> Optional[float]:
     """
     Compute 25-delta risk reversal: IV(25Δ Call) - IV(25Δ Put)
@@ -185,8 +235,13 @@ def compute_rr_25d(event_contracts: List[Dict]) -> Optional[float]:
         >>> rr = compute_rr_25d(contracts)
         >>> print(f"25Δ RR: {rr:.4f}")  # Positive = bullish skew
     """
-    iv_25d_call = interp_iv_at_delta(event_contracts, target_delta=0.25, side="call")
-    iv_25d_put = interp_iv_at_delta(event_contracts, target_delta=0.25, side="put")
+    return _rr_25d_soa(_contracts_to_soa(event_contracts))
+
+
+def _rr_25d_soa(soa: np.ndarray) -> Optional[float]:
+    """compute_rr_25d over a contract array; both wings share one parsed contract array"""
+    iv_25d_call = _iv_at_delta(soa, soa['is_call'], 0.25)
+    iv_25d_put = _iv_at_delta(soa, soa['is_put'], 0.25)
     
     if iv_25d_call is None or iv_25d_put is None:
         return None
@@ -215,40 +270,30 @@ def compute_pcr(event_contracts: List[Dict]) -> Dict[str, Optional[float]]:
         >>> print(f"Volume PCR: {pcr['vol_pcr']:.2f}")
         >>> print(f"Notional PCR: {pcr['notional_pcr']:.2f}")
     """
-    call_volume = 0
-    put_volume = 0
-    call_notional = 0.0
-    put_notional = 0.0
-    
-    for contract in event_contracts:
-        details = contract.get("details", {})
-        contract_type = details.get("contract_type", "").lower()
-        volume = contract.get("day", {}).get("volume", 0) or 0
-        
-        # Get price for notional calculation
-        last_trade = contract.get("last_trade", {})
-        price = last_trade.get("price") or contract.get("day", {}).get("close")
-        
-        if price is None or price <= 0:
-            continue
-        
-        notional = volume * price * 100  # 100 shares per contract
-        
-        if contract_type == "call":
-            call_volume += volume
-            call_notional += notional
-        elif contract_type == "put":
-            put_volume += volume
-            put_notional += notional
+    return _pcr_soa(_contracts_to_soa(event_contracts))
+
+
+def _pcr_soa(soa: np.ndarray) -> Dict[str, Optional[float]]:
+    """compute_pcr over a contract array"""
+    # Only contracts with a positive price count toward either ratio
+    priced = soa['price'] > 0
+    calls = priced & soa['is_call']
+    puts = priced & soa['is_put']
+    notional = soa['vol'] * soa['price'] * 100  # 100 shares per contract
+    
+    call_volume = soa['vol'][calls].sum()
+    put_volume = soa['vol'][puts].sum()
+    call_notional = notional[calls].sum()
+    put_notional = notional[puts].sum()
     
     vol_pcr = None
     notional_pcr = None
     
     if call_volume > 0:
-        vol_pcr = put_volume / call_volume
+        vol_pcr = float(put_volume / call_volume)
     
     if call_notional > 0:
-        notional_pcr = put_notional / call_notional
+        notional_pcr = float(put_notional / call_notional)
     
     return {
         "vol_pcr": vol_pcr,
@@ -279,18 +324,16 @@ def compute_volume_thrust(
         >>> print(f"Call thrust: {thrust['call_thrust']:.2%}")
         >>> print(f"Net thrust: {thrust['net_thrust']:.2%}")
     """
-    call_volume = 0
-    put_volume = 0
-    
-    for contract in event_contracts:
-        details = contract.get("details", {})
-        contract_type = details.get("contract_type", "").lower()
-        volume = contract.get("day", {}).get("volume", 0) or 0
-        
-        if contract_type == "call":
-            call_volume += volume
-        elif contract_type == "put":
-            put_volume += volume
+    return _volume_thrust_soa(_contracts_to_soa(event_contracts), med20_volumes)
+
+
+def _volume_thrust_soa(
+    soa: np.ndarray,
+    med20_volumes: Dict[str, float]
+) -> Dict[str, Optional[float]]:
+    """compute_volume_thrust over a contract array"""
+    call_volume = soa['vol'][soa['is_call']].sum()
+    put_volume = soa['vol'][soa['is_put']].sum()
     
     call_thrust = None
     put_thrust = None
@@ -300,10 +343,10 @@ def compute_volume_thrust(
     put_med20 = med20_volumes.get("put_med20", 0)
     
     if call_med20 > 0:
-        call_thrust = (call_volume - call_med20) / call_med20
+        call_thrust = float((call_volume - call_med20) / call_med20)
     
     if put_med20 > 0:
-        put_thrust = (put_volume - put_med20) / put_med20
+        put_thrust = float((put_volume - put_med20) / put_med20)
     
     if call_thrust is not None and put_thrust is not None:
         net_thrust = call_thrust - put_thrust
@@ -351,17 +394,17 @@ def compute_iv_bump(
     if atm_event is None:
         return None
     
-    neighbor_ivs = []
-    if atm_prev is not None:
-        neighbor_ivs.append(atm_prev)
-    if atm_next is not None:
-        neighbor_ivs.append(atm_next)
-    
-    if not neighbor_ivs:
+    # Plain float arithmetic: np.mean on one or two scalars costs more than the math
+    if atm_prev is None and atm_next is None:
         return None
+    if atm_prev is None:
+        avg_neighbor = atm_next
+    elif atm_next is None:
+        avg_neighbor = atm_prev
+    else:
+        avg_neighbor = (atm_prev + atm_next) / 2.0
     
-    avg_neighbor = np.mean(neighbor_ivs)
-    return atm_event - avg_neighbor
+    return float(atm_event - avg_neighbor)
 
 
 def compute_spread_pct_atm(
@@ -392,49 +435,32 @@ def compute_spread_pct_atm(
     
     # Extract spot price if not provided
     if spot_price is None:
-        for contract in event_contracts:
-            underlying_price = contract.get("underlying_asset", {}).get("price")
-            if underlying_price:
-                spot_price = underlying_price
-                break
-        
+        spot_price = _extract_spot(event_contracts)
         if spot_price is None:
             return None
     
-    # Find ATM contracts (within ±5% of spot)
-    spreads = []
-    
-    for contract in event_contracts:
-        details = contract.get("details", {})
-        strike = details.get("strike_price")
-        
-        if strike is None:
-            continue
-        
-        # Check if near ATM
-        if abs(strike - spot_price) / spot_price > 0.05:
-            continue
-        
-        # Get bid and ask
-        last_quote = contract.get("last_quote", {})
-        bid = last_quote.get("bid")
-        ask = last_quote.get("ask")
-        
-        if bid is None or ask is None or bid <= 0 or ask <= 0:
-            continue
-        
-        mid = (bid + ask) / 2.0
-        if mid <= 0:
-            continue
-        
-        spread_pct = (ask - bid) / mid * 100
-        spreads.append(spread_pct)
-    
-    if not spreads:
+    return _spread_pct_atm_soa(_contracts_to_soa(event_contracts), spot_price)
+
+
+def _spread_pct_atm_soa(soa: np.ndarray, spot_price: float) -> Optional[float]:
+    """compute_spread_pct_atm over a contract array with a known spot price"""
+    bid, ask = soa['bid'], soa['ask']
+    
+    # ATM contracts (within ±5% of spot) with two-sided positive quotes
+    atm = (
+        ~np.isnan(soa['strike'])
+        & (np.abs(soa['strike'] - spot_price) / spot_price <= 0.05)
+        & (bid > 0)
+        & (ask > 0)
+    )
+    if not atm.any():
         return None
     
+    mid = (bid[atm] + ask[atm]) / 2.0
+    spread_pct = (ask[atm] - bid[atm]) / mid * 100
+    
     # Return average spread
-    return np.mean(spreads)
+    return float(spread_pct.mean())
 
 
 def compute_mom_betaadj(
@@ -584,24 +610,21 @@ def compute_all_signals(
     """
     signals = {}
     
+    # Parse the event chain once; every event-expiry signal reads this array
+    event_soa = _contracts_to_soa(event_contracts or [])
+    
     # Extract spot price
-    spot_price = None
-    if event_contracts:
-        for contract in event_contracts:
-            underlying_price = contract.get("underlying_asset", {}).get("price")
-            if underlying_price:
-                spot_price = underlying_price
-                break
+    spot_price = _extract_spot(event_contracts) if event_contracts else None
     
     # Compute signals
-    signals['rr_25d'] = compute_rr_25d(event_contracts)
+    signals['rr_25d'] = _rr_25d_soa(event_soa)
     
-    pcr = compute_pcr(event_contracts)
+    pcr = _pcr_soa(event_soa)
     signals['vol_pcr'] = pcr['vol_pcr']
     signals['notional_pcr'] = pcr['notional_pcr']
     
     if med20_volumes:
-        thrust = compute_volume_thrust(event_contracts, med20_volumes)
+        thrust = _volume_thrust_soa(event_soa, med20_volumes)
         signals['call_thrust'] = thrust['call_thrust']
         signals['put_thrust'] = thrust['put_thrust']
         signals['net_thrust'] = thrust['net_thrust']
@@ -611,7 +634,9 @@ def compute_all_signals(
         signals['net_thrust'] = None
     
     # ATM IV and bump
-    signals['atm_iv_event'] = atm_iv(event_contracts, spot_price)
+    signals['atm_iv_event'] = (
+        _atm_iv_soa(event_soa, spot_price) if spot_price is not None else None
+    )
     
     atm_prev = None
     atm_next = None
@@ -634,7 +659,9 @@ def compute_all_signals(
     )
     
     # Spread
-    signals['spread_pct_atm'] = compute_spread_pct_atm(event_contracts, spot_price)
+    signals['spread_pct_atm'] = (
+        _spread_pct_atm_soa(event_soa, spot_price) if spot_price is not None else None
+    )
     
     # Momentum
     mom = compute_mom_betaadj(
@@ -657,3 +684,162 @@ def compute_all_signals(
     
     return signals
 
+
+# Columns of the compute_all_signals_batch frame, in order
+_BATCH_COLUMNS = [
+    'symbol', 'event_date', 'rr_25d', 'vol_pcr', 'notional_pcr',
+    'call_thrust', 'put_thrust', 'net_thrust', 'atm_iv_event', 'atm_iv_prev',
+    'atm_iv_next', 'iv_bump', 'spread_pct_atm',
+    'stock_return', 'sector_return', 'beta', 'beta_adj_return',
+]
+
+
+def compute_all_signals_batch(
+    events: List[Dict],
+    include_momentum: bool = True
+) -> pd.DataFrame:
+    """
+    Compute all signals for a batch of events (backtest-style API)
+    
+    Every event chain is parsed once into one concatenated contract array.
+    PCR, volume thrust and ATM spread are then reduced for all events at once
+    with ``np.bincount``; only the interpolation signals (RR, ATM IV) and
+    momentum are evaluated per event.
+    
+    Args:
+        events: List of dicts with the keyword arguments of compute_all_signals
+            (``symbol``, ``event_date``, ``event_contracts`` and optionally
+            ``prev_contracts``, ``next_contracts``, ``med20_volumes``,
+            ``lookback_days``, ``sector_symbol``)
+        include_momentum: When False, skip compute_mom_betaadj (no price
+            requests) and leave the momentum columns empty
+    
+    Returns:
+        DataFrame with one row per event: symbol, event_date and the
+        compute_all_signals keys (missing values are NaN)
+    
+    Example:
+        >>> df = compute_all_signals_batch([
+        ...     {"symbol": "AAPL", "event_date": d, "event_contracts": chain},
+        ...     {"symbol": "MSFT", "event_date": d, "event_contracts": chain2},
+        ... ])
+        >>> print(df[['symbol', 'rr_25d', 'vol_pcr']])
+    """
+    n_events = len(events)
+    if n_events == 0:
+        return pd.DataFrame(columns=_BATCH_COLUMNS)
+    
+    # Parse every event chain once and tag contracts with their event index
+    chains = [_contracts_to_soa(event.get("event_contracts") or []) for event in events]
+    sizes = np.array([len(chain) for chain in chains])
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    soa = np.concatenate(chains)
+    event_idx = np.repeat(np.arange(n_events), sizes)
+    
+    spots = np.array([
+        _extract_spot(event.get("event_contracts") or []) for event in events
+    ], dtype=np.float64)
+    
+    def per_event(mask: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        return np.bincount(event_idx[mask], weights=weights[mask], minlength=n_events)
+    
+    def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator > 0, numerator / denominator, np.nan)
+    
+    # PCR: only priced contracts count
+    priced = soa['price'] > 0
+    notional = soa['vol'] * soa['price'] * 100
+    vol_pcr = ratio(
+        per_event(priced & soa['is_put'], soa['vol']),
+        per_event(priced & soa['is_call'], soa['vol'])
+    )
+    notional_pcr = ratio(
+        per_event(priced & soa['is_put'], notional),
+        per_event(priced & soa['is_call'], notional)
+    )
+    
+    # Volume thrust against each event's med20 baselines
+    call_volume = per_event(soa['is_call'], soa['vol'])
+    put_volume = per_event(soa['is_put'], soa['vol'])
+    call_med20 = np.full(n_events, np.nan)
+    put_med20 = np.full(n_events, np.nan)
+    for i, event in enumerate(events):
+        med20_volumes = event.get("med20_volumes")
+        if med20_volumes:
+            call_med20[i] = med20_volumes.get("call_med20", 0)
+            put_med20[i] = med20_volumes.get("put_med20", 0)
+    call_thrust = ratio(call_volume - call_med20, call_med20)
+    put_thrust = ratio(put_volume - put_med20, put_med20)
+    
+    # ATM spread: mean over the ±5% band with two-sided positive quotes
+    contract_spot = spots[event_idx]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        in_band = np.abs(soa['strike'] - contract_spot) / contract_spot <= 0.05
+        spread_pct = (soa['ask'] - soa['bid']) / ((soa['bid'] + soa['ask']) / 2.0) * 100
+    atm = in_band & (soa['bid'] > 0) & (soa['ask'] > 0)
+    spread_pct_atm = ratio(
+        per_event(atm, spread_pct),
+        np.bincount(event_idx[atm], minlength=n_events).astype(np.float64)
+    )
+    
+    # Interpolation signals and neighbour expiries stay per event
+    rr_25d = np.full(n_events, np.nan)
+    atm_iv_event = np.full(n_events, np.nan)
+    atm_iv_prev = np.full(n_events, np.nan)
+    atm_iv_next = np.full(n_events, np.nan)
+    iv_bump = np.full(n_events, np.nan)
+    momentum = {
+        key: np.full(n_events, np.nan)
+        for key in ('stock_return', 'sector_return', 'beta', 'beta_adj_return')
+    }
+    
+    for i, event in enumerate(events):
+        chain = soa[offsets[i]:offsets[i + 1]]
+        spot_price = None if np.isnan(spots[i]) else float(spots[i])
+        
+        rr = _rr_25d_soa(chain)
+        atm_event = _atm_iv_soa(chain, spot_price) if spot_price is not None else None
+        atm_prev = None
+        atm_next = None
+        if event.get("prev_contracts"):
+            atm_prev = atm_iv(event["prev_contracts"], spot_price)
+        if event.get("next_contracts"):
+            atm_next = atm_iv(event["next_contracts"], spot_price)
+        bump = compute_iv_bump(atm_event, atm_prev, atm_next)
+        
+        for column, value in (
+            (rr_25d, rr), (atm_iv_event, atm_event), (atm_iv_prev, atm_prev),
+            (atm_iv_next, atm_next), (iv_bump, bump)
+        ):
+            if value is not None:
+                column[i] = value
+        
+        if include_momentum:
+            mom = compute_mom_betaadj(
+                event["symbol"],
+                event["event_date"],
+                lookback_days=event.get("lookback_days", 3),
+                sector_symbol=event.get("sector_symbol", "SPY")
+            )
+            if mom:
+                for key, column in momentum.items():
+                    if mom[key] is not None:
+                        column[i] = mom[key]
+    
+    return pd.DataFrame({
+        'symbol': [event["symbol"] for event in events],
+        'event_date': [event["event_date"] for event in events],
+        'rr_25d': rr_25d,
+        'vol_pcr': vol_pcr,
+        'notional_pcr': notional_pcr,
+        'call_thrust': call_thrust,
+        'put_thrust': put_thrust,
+        'net_thrust': call_thrust - put_thrust,
+        'atm_iv_event': atm_iv_event,
+        'atm_iv_prev': atm_iv_prev,
+        'atm_iv_next': atm_iv_next,
+        'iv_bump': iv_bump,
+        'spread_pct_atm': spread_pct_atm,
+        **momentum,
+    })
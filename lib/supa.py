@@ -7,6 +7,18 @@ load_dotenv()
 
 SUPA = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_ROLE_KEY"])
 
+# Table handles for the hot pre-market tables, built once at import.
+# Each .select()/.upsert() on a handle starts a fresh query, so reuse is safe.
+DAILY_SIGNALS_TBL = SUPA.schema("public").table("daily_signals")
+OI_DELTAS_TBL = SUPA.schema("public").table("oi_deltas")
+OPTION_SNAPSHOTS_TBL = SUPA.schema("public").table("option_snapshots")
+
+_TABLE_REFS = {
+    "public.daily_signals": DAILY_SIGNALS_TBL,
+    "public.oi_deltas": OI_DELTAS_TBL,
+    "public.option_snapshots": OPTION_SNAPSHOTS_TBL,
+}
+
 def _get_table_ref(table):
     """
     Get a table reference, handling schema-prefixed table names.
@@ -15,8 +27,10 @@ def _get_table_ref(table):
         table: Either "table_name" or "schema.table_name"
     
     Returns:
-        Supabase table reference
+        Supabase table reference (cached handle for the hot tables)
     """
+    if table in _TABLE_REFS:
+        return _TABLE_REFS[table]
     if "." in table:
         schema, table_name = table.split(".", 1)
         return SUPA.schema(schema).table(table_name)
@@ -1,6 +1,17 @@
-"""Pytest configuration for ensuring local packages are importable."""
+"""Pytest configuration and shared fixtures.
+
+Puts the project root, ``lib`` and ``config`` on ``sys.path`` and stubs the
+Supabase client once, so individual test modules import directly.
+"""
+import os
 import sys
+import types
 from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
@@ -9,3 +20,273 @@ if str(PROJECT_ROOT / "lib") not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT / "lib"))
 if str(PROJECT_ROOT / "config") not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT / "config"))
+
+
+class _NullSupabase:  # pragma: no cover - test helper
+    """Minimal stub matching the Supabase client interface used by the jobs."""
+
+    def schema(self, _):
+        return self
+
+    def table(self, _):
+        return self
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, *_args, **_kwargs):
+        return self
+
+    def in_(self, *_args, **_kwargs):
+        return self
+
+    def gte(self, *_args, **_kwargs):
+        return self
+
+    def lt(self, *_args, **_kwargs):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def range(self, *_args, **_kwargs):
+        return self
+
+    def upsert(self, *_args, **_kwargs):
+        return self
+
+    def insert(self, *_args, **_kwargs):
+        return self
+
+    def execute(self):
+        return types.SimpleNamespace(data=[], count=0)
+
+
+# Stand-in for the ``supabase`` package when it is not installed
+_SUPABASE_MODULE_STUB = types.SimpleNamespace(
+    create_client=lambda *_args, **_kwargs: _NullSupabase()
+)
+
+
+def pytest_addoption(parser):
+    """Register the opt-in flag for the ``bench`` micro-benchmarks."""
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run tests marked 'bench' (requires pytest-benchmark)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``bench`` tests unless ``--run-benchmarks`` is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_bench = pytest.mark.skip(reason="benchmarks need --run-benchmarks")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip_bench)
+
+
+def pytest_configure(config):
+    """
+    Stub the Supabase client and credentials once per session.
+
+    ``lib.supa`` creates a module-level client on import, so the stub must be
+    in place before any job module is collected. Tests that need data swap
+    in ``fake_supabase`` per test.
+    """
+    sys.modules.setdefault("supabase", _SUPABASE_MODULE_STUB)
+    os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+    os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "service-role-key")
+
+
+def _contract(contract_type, delta, iv):
+    """Build a minimal Polygon snapshot contract for signal tests."""
+    return {
+        "details": {"contract_type": contract_type},
+        "greeks": {"delta": delta},
+        "implied_volatility": iv,
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_option_chain():
+    """
+    Shared option chain for delta-based signal tests.
+
+    Returns:
+        Tuple of (calls, puts, full_chain), each a tuple of contract dicts.
+        Tuples prevent tests from growing the shared session chain.
+    """
+    calls = (
+        _contract("call", 0.20, 0.30),
+        _contract("call", 0.30, 0.35),
+    )
+    puts = (
+        _contract("put", -0.30, 0.31),
+        _contract("put", -0.20, 0.29),
+    )
+    return calls, puts, calls + puts
+
+
+def _quoted_contract(contract_type, strike, delta, iv, volume, price, bid, ask):
+    """Build a Polygon snapshot contract carrying every field signals read."""
+    return {
+        "details": {"contract_type": contract_type, "strike_price": strike},
+        "greeks": {"delta": delta},
+        "implied_volatility": iv,
+        "day": {"volume": volume},
+        "last_trade": {"price": price},
+        "last_quote": {"bid": bid, "ask": ask},
+        "underlying_asset": {"price": 150.0},
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_contract_soa():
+    """
+    Three-strike chain around a 150 spot, parsed once per session.
+
+    Returns:
+        Tuple of (soa, contracts): the read-only structured array from
+        ``lib.signals._contracts_to_soa`` and the contract dicts it came from.
+    """
+    from lib.signals import _contracts_to_soa
+
+    contracts = (
+        _quoted_contract("call", 148, 0.60, 0.30, 100, 5.0, 4.8, 5.2),
+        _quoted_contract("call", 150, 0.50, 0.31, 150, 4.0, 3.9, 4.1),
+        _quoted_contract("call", 152, 0.20, 0.33, 50, 3.0, 2.9, 3.1),
+        _quoted_contract("put", 148, -0.30, 0.32, 40, 3.0, 2.9, 3.1),
+        _quoted_contract("put", 150, -0.50, 0.31, 60, 4.0, 3.9, 4.1),
+        _quoted_contract("put", 152, -0.65, 0.30, 80, 5.0, 4.8, 5.2),
+    )
+    soa = _contracts_to_soa(list(contracts))
+    soa.flags.writeable = False
+    return soa, contracts
+
+
+def _random_chain(rng, n, spot=150.0):
+    """Build a random chain of n contracts with missing IVs/deltas and zero volumes."""
+    strikes = np.round(rng.uniform(0.5 * spot, 1.5 * spot, n), 1)
+    is_call = rng.random(n) < 0.5
+    deltas = np.where(is_call, 1.0, -1.0) * rng.uniform(0.01, 0.99, n)
+    ivs = rng.uniform(0.1, 1.5, n)
+    volumes = rng.integers(0, 500, n)
+    volumes[rng.random(n) < 0.2] = 0
+    bids = rng.uniform(0.05, 10.0, n)
+    asks = bids + rng.uniform(0.0, 1.0, n)
+    missing_iv = rng.random(n) < 0.1
+    missing_delta = rng.random(n) < 0.1
+
+    return [
+        {
+            "details": {
+                "contract_type": "call" if is_call[i] else "put",
+                "strike_price": float(strikes[i]),
+            },
+            "greeks": {"delta": None if missing_delta[i] else float(deltas[i])},
+            "implied_volatility": None if missing_iv[i] else float(ivs[i]),
+            "day": {"volume": int(volumes[i])},
+            "last_trade": {"price": float((bids[i] + asks[i]) / 2)},
+            "last_quote": {"bid": float(bids[i]), "ask": float(asks[i])},
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(scope="session")
+def random_chain():
+    """
+    Factory for seeded random option chains.
+
+    Returns:
+        Callable ``(rng, n, spot=150.0)`` building ``n`` contract dicts from a
+        ``np.random.Generator``; each call returns a fresh list.
+    """
+    return _random_chain
+
+
+class _FakeSupabaseClient:  # pragma: no cover - helper
+    """Simple Supabase stub returning predefined rows."""
+
+    def __init__(self, rows: Iterable[dict]):
+        self._rows = list(rows)
+
+    def schema(self, _name: str) -> "_FakeSupabaseClient":
+        return self
+
+    def table(self, _name: str) -> "_FakeSupabaseQuery":
+        return _FakeSupabaseQuery(self._rows)
+
+
+class _FakeSupabaseQuery:  # pragma: no cover - helper
+    """Query object that mimics the chained supabase API used in the job."""
+
+    def __init__(self, rows: List[dict]):
+        self._rows = rows
+        self._filters = []
+
+    def select(self, *_args, **_kwargs) -> "_FakeSupabaseQuery":
+        return self
+
+    def gte(self, field: str, value: str) -> "_FakeSupabaseQuery":
+        self._filters.append(("gte", field, value))
+        return self
+
+    def lt(self, field: str, value: str) -> "_FakeSupabaseQuery":
+        self._filters.append(("lt", field, value))
+        return self
+
+    def execute(self):
+        if not self._rows:
+            return types.SimpleNamespace(data=[])
+
+        # Build one boolean mask per filter over the whole rowset and AND them
+        parsed = {}
+        masks = [np.ones(len(self._rows), dtype=bool)]
+        for op, field, value in self._filters:
+            if field not in parsed:
+                parsed[field] = pd.to_datetime(
+                    [row[field] for row in self._rows], utc=True
+                ).values
+            ts = parsed[field]
+            cutoff = pd.to_datetime(value, utc=True).to_datetime64()
+            if op == "gte":
+                masks.append(ts >= cutoff)
+            elif op == "lt":
+                masks.append(ts < cutoff)
+
+        mask = np.logical_and.reduce(masks)
+        records = [dict(self._rows[i]) for i in np.flatnonzero(mask)]
+
+        return types.SimpleNamespace(data=records)
+
+
+@pytest.fixture(scope="session")
+def supabase_stub():
+    """
+    The stub client class ``lib.supa`` is built with.
+
+    Skips when a real ``supabase`` package was importable first, since the
+    module-level client is then a real one.
+
+    Returns:
+        The ``_NullSupabase`` class.
+    """
+    if sys.modules.get("supabase") is not _SUPABASE_MODULE_STUB:
+        pytest.skip("lib.supa uses the installed supabase package")
+    return _NullSupabase
+
+
+@pytest.fixture
+def fake_supabase():
+    """
+    Factory for an in-memory Supabase client.
+
+    Returns:
+        Callable taking an iterable of row dicts and returning a client whose
+        ``schema().table().select().gte().lt().execute()`` chain filters them.
+    """
+    return _FakeSupabaseClient
@@ -1,8 +1,19 @@
 """
 Tests for data provider functions
+
+These hit the live Finnhub and Polygon APIs. They are marked ``integration``
+(deselect with ``pytest -m "not integration"``) and skip when the client
+package or API key is missing.
 """
+import os
 from datetime import date, datetime, timedelta
 import pytest
+
+pytestmark = pytest.mark.integration
+
+# lib imports finnhub_client at package import time
+pytest.importorskip("finnhub")
+
 from lib import (
     get_upcoming_earnings,
     get_expiries,
@@ -12,6 +23,9 @@ from lib import (
 )
 
 
+@pytest.mark.skipif(
+    not os.getenv("FINNHUB_API_KEY"), reason="FINNHUB_API_KEY not set"
+)
 class TestFinnhubProvider:
     """Test Finnhub data provider functions"""
     
@@ -41,6 +55,9 @@ class TestFinnhubProvider:
         assert isinstance(results, list)
 
 
+@pytest.mark.skipif(
+    not os.getenv("POLYGON_API_KEY"), reason="POLYGON_API_KEY not set"
+)
 class TestPolygonProvider:
     """Test Polygon data provider functions"""
     
@@ -151,6 +151,20 @@ class TestFindEventAndNeighbors:
         assert result["prev"] == date(2025, 10, 26)
         assert result["next"] == date(2025, 10, 29)
 
+    def test_attribute_and_key_access(self):
+        """Result supports attribute access and the legacy dict-style keys"""
+        earnings = datetime(2025, 10, 26, 16, 0)
+        expiries = [date(2025, 10, 25), date(2025, 11, 1)]
+
+        result = find_event_and_neighbors(earnings, expiries)
+
+        assert result.event == result["event"] == date(2025, 11, 1)
+        assert result.prev == result.get("prev") == date(2025, 10, 25)
+        assert result.next is None
+        assert result.get("missing") is None
+        with pytest.raises(KeyError):
+            result["missing"]
+
 
 class TestValidateEventExpiries:
     """Test validate_event_expiries function"""
@@ -360,6 +374,61 @@ class TestFilterExpiriesAroundEarnings:
         # Next is 14 days after event (Nov 15 - Nov 1)
         assert result["dte"]["next"] == 14
 
+    def test_batch_expiry_lookup(self):
+        """Test that the batch lookup is called once with unique symbols"""
+        earnings_events = [
+            {"symbol": "AAPL", "earnings_ts": datetime(2025, 10, 26, 16, 0)},
+            {"symbol": "MSFT", "earnings_ts": datetime(2025, 10, 26, 16, 0)},
+            {"symbol": "AAPL", "earnings_ts": datetime(2025, 10, 27, 9, 0)}
+        ]
+        calls = []
+        
+        def mock_get_expiries_batch(symbols):
+            calls.append(symbols)
+            return {
+                "AAPL": [date(2025, 10, 25), date(2025, 11, 1), date(2025, 11, 15)],
+                "MSFT": []
+            }
+        
+        def fail_get_expiries(symbol):
+            raise AssertionError("Per-symbol lookup should not be used")
+        
+        results = filter_expiries_around_earnings(
+            earnings_events,
+            fail_get_expiries,
+            get_expiries_batch_func=mock_get_expiries_batch
+        )
+        
+        assert calls == [["AAPL", "MSFT"]]
+        assert [r["symbol"] for r in results] == ["AAPL", "AAPL"]
+        assert results[0]["expiries"]["event"] == date(2025, 11, 1)
+        assert results[0]["dte"]["event"] == 6
+    
+    def test_threaded_lookup_preserves_order(self):
+        """Test concurrent lookups keep input order and isolate failures"""
+        symbols = ["AAPL", "MSFT", "FAIL", "NVDA", "AAPL"]
+        earnings_events = [
+            {"symbol": s, "earnings_ts": datetime(2025, 10, 26, 16, 0)}
+            for s in symbols
+        ]
+        calls = []
+        
+        def mock_get_expiries(symbol):
+            calls.append(symbol)
+            if symbol == "FAIL":
+                raise RuntimeError("boom")
+            return [date(2025, 10, 25), date(2025, 11, 1), date(2025, 11, 15)]
+        
+        results = filter_expiries_around_earnings(
+            earnings_events,
+            mock_get_expiries,
+            max_workers=4
+        )
+        
+        assert sorted(calls) == ["AAPL", "FAIL", "MSFT", "NVDA"]
+        assert [r["symbol"] for r in results] == ["AAPL", "MSFT", "NVDA", "AAPL"]
+        assert all(r["expiries"].event == date(2025, 11, 1) for r in results)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
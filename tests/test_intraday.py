@@ -2,91 +2,23 @@
 
 from __future__ import annotations
 
-import os
-import sys
-import types
 from datetime import date, datetime
-from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pytest
 
-
-class _FakeSupabaseClient:  # pragma: no cover - helper
-    """Simple Supabase stub returning predefined rows."""
-
-    def __init__(self, rows: Iterable[dict]):
-        self._rows = list(rows)
-
-    def schema(self, _name: str) -> "_FakeSupabaseClient":
-        return self
-
-    def table(self, _name: str) -> "_FakeSupabaseQuery":
-        return _FakeSupabaseQuery(self._rows)
-
-
-class _FakeSupabaseQuery:  # pragma: no cover - helper
-    """Query object that mimics the chained supabase API used in the job."""
-
-    def __init__(self, rows: List[dict]):
-        self._rows = rows
-        self._filters = []
-
-    def select(self, *_args, **_kwargs) -> "_FakeSupabaseQuery":
-        return self
-
-    def gte(self, field: str, value: str) -> "_FakeSupabaseQuery":
-        self._filters.append(("gte", field, value))
-        return self
-
-    def lt(self, field: str, value: str) -> "_FakeSupabaseQuery":
-        self._filters.append(("lt", field, value))
-        return self
-
-    def execute(self):
-        def _to_datetime(val):
-            if isinstance(val, datetime):
-                return val
-            return datetime.fromisoformat(val)
-
-        records = []
-        for row in self._rows:
-            include = True
-            for op, field, value in self._filters:
-                cutoff = _to_datetime(value)
-                ts = _to_datetime(row[field])
-                if op == "gte" and ts < cutoff:
-                    include = False
-                    break
-                if op == "lt" and ts >= cutoff:
-                    include = False
-                    break
-            if include:
-                records.append(dict(row))
-
-        return types.SimpleNamespace(data=records)
-
-
-fake_supabase_module = types.SimpleNamespace(create_client=lambda *_args, **_kwargs: _FakeSupabaseClient([]))
-sys.modules.setdefault("supabase", fake_supabase_module)
-os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
-os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "service-role-key")
-
-PROJECT_ROOT = Path(__file__).parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from jobs.intraday import IntradayJob
 
 
 @pytest.fixture
-def job(monkeypatch):
+def job(monkeypatch, fake_supabase):
     """Provide an ``IntradayJob`` with a configurable Supabase stub."""
 
     def _factory(rows: Iterable[dict]):
-        client = _FakeSupabaseClient(rows)
+        client = fake_supabase(rows)
         monkeypatch.setattr("jobs.intraday.SUPA", client)
         return IntradayJob(
             trade_date=date(2024, 5, 1),
@@ -161,7 +93,10 @@ def test_load_daily_universe_combines_after_close_and_pre_open(job, monkeypatch)
 
     universe = intraday_job.load_daily_universe()
 
-    assert set(universe["symbol"]) == {"TOD1", "TOD2", "TOM1", "TOM2"}
+    assert np.array_equal(
+        np.sort(universe["symbol"].to_numpy()),
+        np.array(["TOD1", "TOD2", "TOM1", "TOM2"]),
+    )
 
 
 def test_load_daily_universe_filters_api_fallback(job, monkeypatch):
@@ -220,4 +155,30 @@ def test_load_daily_universe_filters_api_fallback(job, monkeypatch):
 
     universe = intraday_job.load_daily_universe()
 
-    assert set(universe["symbol"]) == {"TOD_OK", "TOM_OK"}
+    assert np.array_equal(
+        np.sort(universe["symbol"].to_numpy()),
+        np.array(["TOD_OK", "TOM_OK"]),
+    )
+
+
+def test_med20_volumes_cached_per_symbol_and_date(job, monkeypatch):
+    """Repeated baselines for the same symbol/day reuse one Polygon call."""
+
+    intraday_job = job([])
+    IntradayJob.clear_volume_cache()
+    calls = []
+
+    def _fake_agg(symbol, start, end, timespan="day"):
+        calls.append((symbol, end))
+        return [{"volume": 1_000_000}, {"volume": 3_000_000}]
+
+    monkeypatch.setattr("jobs.intraday.get_underlying_agg", _fake_agg)
+
+    first = intraday_job._estimate_med20_volumes("AAA")
+    second = intraday_job._estimate_med20_volumes("AAA")
+    intraday_job.trade_date = date(2024, 5, 2)
+    intraday_job._estimate_med20_volumes("AAA")
+
+    assert first == second == {"call_med20": 60_000.0, "put_med20": 40_000.0}
+    assert calls == [("AAA", date(2024, 5, 1)), ("AAA", date(2024, 5, 2))]
+    IntradayJob.clear_volume_cache()
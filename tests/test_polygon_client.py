@@ -0,0 +1,105 @@
+"""
+Unit tests for Polygon client helpers (no network access)
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import threading
+
+import pytest
+import lib.polygon_client as polygon_client
+from lib.polygon_client import (
+    PolygonClient,
+    get_default_client,
+    _expiries_to_fetch,
+)
+
+
+class TestDefaultClient:
+    """Test the shared module-level client"""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_thread_local(self, monkeypatch):
+        monkeypatch.setattr(polygon_client, "_thread_local", threading.local())
+
+    def test_client_is_reused(self, monkeypatch):
+        """Repeated calls share one client and HTTP session"""
+        monkeypatch.setenv("POLYGON_API_KEY", "test_key_12345")
+
+        first = get_default_client()
+        second = get_default_client()
+
+        assert isinstance(first, PolygonClient)
+        assert first is second
+        assert first.session is second.session
+
+    def test_new_client_when_key_changes(self, monkeypatch):
+        """A different API key gets its own client"""
+        monkeypatch.setenv("POLYGON_API_KEY", "key_a")
+        client_a = get_default_client()
+
+        monkeypatch.setenv("POLYGON_API_KEY", "key_b")
+        client_b = get_default_client()
+
+        assert client_a is not client_b
+        assert client_b.api_key == "key_b"
+        assert get_default_client() is client_b
+
+    def test_threads_get_separate_sessions(self, monkeypatch):
+        """Worker threads never share a requests.Session"""
+        monkeypatch.setenv("POLYGON_API_KEY", "test_key_12345")
+        main_client = get_default_client()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_clients = executor.map(lambda _: get_default_client(), range(2))
+            first, second = list(worker_clients)
+
+        assert first is second
+        assert first.session is not main_client.session
+
+        # A later thread never inherits a finished thread's client
+        later = ThreadPoolExecutor(max_workers=1)
+        try:
+            third = later.submit(get_default_client).result()
+        finally:
+            later.shutdown()
+        assert third is not first
+
+    def test_raises_without_key(self, monkeypatch):
+        """Missing key still raises and is not cached"""
+        monkeypatch.delenv("POLYGON_API_KEY", raising=False)
+
+        with pytest.raises(ValueError):
+            get_default_client()
+
+
+class TestExpiriesToFetch:
+    """Test expiry window enumeration for chain snapshots"""
+
+    def test_endpoints_and_fridays(self):
+        """Window includes both endpoints and every Friday between"""
+        # Mon Oct 20 2025 -> Wed Nov 5 2025
+        result = _expiries_to_fetch(date(2025, 10, 20), date(2025, 11, 5))
+
+        assert result == (
+            date(2025, 10, 20),
+            date(2025, 10, 24),
+            date(2025, 10, 31),
+            date(2025, 11, 5),
+        )
+
+    def test_friday_endpoints_not_duplicated(self):
+        """Friday endpoints appear once"""
+        result = _expiries_to_fetch(date(2025, 10, 24), date(2025, 10, 31))
+
+        assert result == (date(2025, 10, 24), date(2025, 10, 31))
+
+    def test_result_is_cached(self):
+        """Repeated windows return the cached tuple"""
+        first = _expiries_to_fetch(date(2025, 1, 6), date(2025, 2, 28))
+        second = _expiries_to_fetch(date(2025, 1, 6), date(2025, 2, 28))
+
+        assert first is second
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
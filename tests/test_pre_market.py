@@ -3,81 +3,158 @@
 These tests focus on the methodology described in ``Method.md``
 for incorporating ΔOI information into the directional score.
 """
-from datetime import date
-from pathlib import Path
-import sys
-import os
+from datetime import date, datetime
 import types
 
 import pandas as pd
 import pytest
 
+import jobs.pre_market as jobs_pre_market
+from jobs.pre_market import OIDeltaResult, PreMarketJob
+
+
+class DummyUpserter:
+    """Utility to capture Supabase upserts during tests."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, table: str, rows, on_conflict=None):  # pragma: no cover - helper
+        self.calls.append({
+            "table": table,
+            "rows": rows,
+            "on_conflict": on_conflict,
+        })
+
+
+@pytest.fixture(scope="module")
+def _job_instance():
+    """Build one ``PreMarketJob`` shared by every test in this module."""
+    return PreMarketJob(recompute_scores=True)
+
+
+@pytest.fixture
+def job(_job_instance, monkeypatch):
+    """Provide the shared ``PreMarketJob`` with a fresh Supabase write stub."""
+    stub = DummyUpserter()
+    monkeypatch.setattr("jobs.pre_market.upsert_rows", stub)
+    _job_instance.asof_ts = datetime.now()
+    return _job_instance, stub
+
 
-class _FakeSupabase:  # pragma: no cover - test helper
-    """Minimal stub matching the Supabase client interface used in tests."""
+class _StaticTable:
+    """Table handle stub returning fixed rows and recording ``eq`` filters."""
 
-    def schema(self, _):
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+
+    def select(self, *_args, **_kwargs):
         return self
 
-    def table(self, _):
+    def eq(self, field, value):
+        self.filters.append((field, value))
         return self
 
+    def execute(self):
+        return types.SimpleNamespace(data=self.rows)
+
+
+def test_load_daily_signals_uses_cached_table(job, monkeypatch):
+    job_instance, _ = job
+    table = _StaticTable(
+        [{"symbol": "AAA", "rr_25d": "0.5", "event_expiry": "2024-07-19"}]
+    )
+    monkeypatch.setattr(jobs_pre_market, "DAILY_SIGNALS_TBL", table)
+
+    df = job_instance.load_daily_signals()
+
+    assert table.filters == [("trade_date", job_instance.trade_date.isoformat())]
+    assert df.loc[0, "rr_25d"] == 0.5
+    assert df.loc[0, "event_expiry"] == date(2024, 7, 19)
+
+
+class _CappedSnapshotTable:
+    """Snapshot table stub that honours ``asof_ts`` bounds and ``range`` but caps each response."""
+
+    def __init__(self, rows, cap):
+        self.rows = rows
+        self.cap = cap
+        self.ranges = []
+        self.bounds = []
+        self._symbols = []
+        self._lower = ""
+        self._upper = "9999"
+        self._range = (0, len(rows) - 1)
+
     def select(self, *_args, **_kwargs):
         return self
 
-    def eq(self, *_args, **_kwargs):
+    def in_(self, _field, values):
+        self._symbols = list(values)
         return self
 
-    def in_(self, *_args, **_kwargs):
+    def gte(self, field, value):
+        self.bounds.append(("gte", field, value))
+        self._lower = value
         return self
 
-    def order(self, *_args, **_kwargs):
+    def lt(self, field, value):
+        self.bounds.append(("lt", field, value))
+        self._upper = value
         return self
 
-    def upsert(self, *_args, **_kwargs):
+    def order(self, *_args, **_kwargs):
         return self
 
-    def insert(self, *_args, **_kwargs):
+    def range(self, start, end):
+        self.ranges.append((start, end))
+        self._range = (start, end)
         return self
 
     def execute(self):
-        return types.SimpleNamespace(data=[], count=0)
-
-
-fake_supabase_module = types.SimpleNamespace(create_client=lambda *_args, **_kwargs: _FakeSupabase())
-sys.modules.setdefault("supabase", fake_supabase_module)
-os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
-os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "service-key")
-
-# Ensure the project root is importable so we can reach ``jobs.pre_market``
-PROJECT_ROOT = Path(__file__).parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from jobs.pre_market import OIDeltaResult, PreMarketJob
-
-
-class DummyUpserter:
-    """Utility to capture Supabase upserts during tests."""
+        matched = sorted(
+            (
+                row
+                for row in self.rows
+                if row["option_symbol"] in self._symbols
+                and self._lower <= row["asof_ts"] < self._upper
+            ),
+            key=lambda row: row["asof_ts"],
+            reverse=True,
+        )
+        start, end = self._range
+        return types.SimpleNamespace(data=matched[start : min(end + 1, start + self.cap)])
 
-    def __init__(self) -> None:
-        self.calls = []
 
-    def __call__(self, table: str, rows, on_conflict=None):  # pragma: no cover - helper
-        self.calls.append({
-            "table": table,
-            "rows": rows,
-            "on_conflict": on_conflict,
-        })
+def test_latest_snapshot_oi_pages_past_response_cap(job, monkeypatch):
+    job_instance, _ = job
+    monkeypatch.setattr(job_instance, "trade_date", date(2024, 7, 19))
+    monkeypatch.setattr(job_instance, "asof_ts", datetime(2024, 7, 22, 8, 30))
+    # AAA snapshots often on the trade date; BBB's only in-window row sits
+    # past the first response. Older history and this run's own snapshot
+    # fall outside the read window.
+    rows = [
+        {"option_symbol": "AAA", "oi": 100 + hour, "asof_ts": f"2024-07-19T{hour:02d}:00:00"}
+        for hour in range(9, 19)
+    ]
+    rows += [
+        {"option_symbol": "BBB", "oi": 42, "asof_ts": "2024-07-19T08:00:00"},
+        {"option_symbol": "BBB", "oi": 7, "asof_ts": "2024-07-18T16:30:00"},
+        {"option_symbol": "AAA", "oi": 1, "asof_ts": "2024-07-22T08:30:00"},
+    ]
+    table = _CappedSnapshotTable(rows, cap=4)
+    monkeypatch.setattr(jobs_pre_market, "OPTION_SNAPSHOTS_TBL", table)
+    monkeypatch.setattr(jobs_pre_market, "SNAPSHOT_PAGE_SIZE", 4)
 
+    latest = job_instance._latest_snapshot_oi(["AAA", "BBB"])
 
-@pytest.fixture
-def job(monkeypatch):
-    """Provide a ``PreMarketJob`` instance with Supabase writes stubbed."""
-    stub = DummyUpserter()
-    monkeypatch.setattr("jobs.pre_market.upsert_rows", stub)
-    inst = PreMarketJob(recompute_scores=True)
-    return inst, stub
+    assert latest == {"AAA": 118, "BBB": 42}
+    assert table.ranges == [(0, 3), (4, 7), (8, 11)]
+    assert table.bounds[:2] == [
+        ("gte", "asof_ts", "2024-07-19T00:00:00"),
+        ("lt", "asof_ts", "2024-07-22T08:30:00"),
+    ]
 
 
 def test_atm_window_strikes_focuses_on_atm(job):
@@ -98,6 +175,26 @@ def test_atm_window_strikes_focuses_on_atm(job):
     assert strikes == [98.0, 99.0, 100.0, 101.0, 102.0]
 
 
+def test_atm_window_strikes_edge_of_ladder(job):
+    job_instance, _ = job
+    contracts = [
+        {"details": {"strike_price": strike, "contract_type": "call"}}
+        for strike in [100, 105, 110, 115]
+    ]
+
+    # Near the bottom of the ladder the window is truncated, not shifted
+    assert job_instance._atm_window_strikes(contracts, spot_price=99) == [
+        100.0,
+        105.0,
+        110.0,
+    ]
+    assert job_instance._atm_window_strikes(list(reversed(contracts)), spot_price=99) == [
+        100.0,
+        105.0,
+        110.0,
+    ]
+
+
 def test_recompute_dirscores_incorporates_delta_oi(job):
     job_instance, stub = job
 
@@ -167,8 +264,73 @@ def test_recompute_dirscores_incorporates_delta_oi(job):
 
     # The recompute should persist refreshed scores back to Supabase
     assert stub.calls, "Expected recomputed scores to be upserted"
-    last_call = stub.calls[-1]
-    assert last_call["table"] == "public.daily_signals"
-    assert last_call["on_conflict"] == "trade_date,symbol"
-    stored_symbols = {entry["symbol"] for entry in last_call["rows"]}
+    signal_calls = [call for call in stub.calls if call["table"] == "public.daily_signals"]
+    assert signal_calls
+    assert all(call["on_conflict"] == "trade_date,symbol" for call in signal_calls)
+    stored_symbols = {entry["symbol"] for call in signal_calls for entry in call["rows"]}
     assert stored_symbols == {"AAA", "BBB"}
+
+
+def test_upsert_batched_chunks_rows(job, monkeypatch):
+    job_instance, stub = job
+    monkeypatch.setattr("jobs.pre_market.UPSERT_BATCH_SIZE", 2)
+
+    rows = [{"symbol": f"S{i}"} for i in range(5)]
+    job_instance._upsert_batched("public.oi_deltas", rows, on_conflict="trade_date,symbol")
+
+    assert [len(call["rows"]) for call in stub.calls] == [2, 2, 1]
+    assert [entry for call in stub.calls for entry in call["rows"]] == rows
+    assert all(call["table"] == "public.oi_deltas" for call in stub.calls)
+
+
+def test_compute_deltas_bulk_fetches_prior_oi(job, monkeypatch):
+    job_instance, stub = job
+
+    def _chain(symbol):
+        return [
+            {
+                "ticker": f"O:{symbol}{side}{strike}",
+                "details": {"strike_price": strike, "contract_type": side},
+                "underlying_asset": {"price": 100.0},
+                "open_interest": 10,
+            }
+            for strike in (99, 100, 101)
+            for side in ("call", "put")
+        ]
+
+    monkeypatch.setattr(
+        job_instance,
+        "snapshot_event_contracts",
+        lambda symbol, _expiry: _chain(symbol) if symbol != "EMPTY" else [],
+    )
+
+    lookups = []
+
+    def _fake_latest(option_symbols):
+        lookups.append(list(option_symbols))
+        return {ticker: 4 for ticker in option_symbols if "call" in ticker}
+
+    monkeypatch.setattr(job_instance, "_latest_snapshot_oi", _fake_latest)
+
+    expiry = date(2024, 7, 19)
+    results = job_instance.compute_deltas(
+        [("AAA", expiry), ("EMPTY", expiry), ("BBB", None), ("CCC", expiry)]
+    )
+
+    # One prior-OI lookup covering every windowed contract
+    assert len(lookups) == 1
+    assert {ticker.split("call")[0].split("put")[0] for ticker in lookups[0]} == {
+        "O:AAA",
+        "O:CCC",
+    }
+
+    assert [r.symbol for r in results] == ["AAA", "EMPTY", "BBB", "CCC"]
+    assert [r.detail for r in results] == [
+        "",
+        "empty_snapshot",
+        "missing_event_expiry",
+        "",
+    ]
+    assert results[0].delta_oi_calls == 3 * (10 - 4)
+    assert results[0].delta_oi_puts == 3 * 10
+    assert [call["table"] for call in stub.calls] == ["public.option_snapshots"] * 2
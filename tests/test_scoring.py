@@ -8,9 +8,12 @@ import pandas as pd
 from lib.scoring import (
     normalize_today,
     compute_dirscore,
+    compute_dirscore_vectorized,
     compute_scores_batch,
     compute_intraday_dirscore,
-    resolve_intraday_decision
+    compute_intraday_dirscore_vectorized,
+    resolve_intraday_decision,
+    resolve_intraday_decision_vectorized
 )
 
 
@@ -68,6 +71,17 @@ class TestNormalizeToday:
         assert 'z_constant' in result.columns
         assert (result['z_constant'] == 0.0).all()
     
+    def test_zero_variance_with_nans(self):
+        """Test constant columns with gaps are not inflated by float noise"""
+        df = pd.DataFrame({
+            'symbol': list('ABCDEFGHIJ'),
+            'constant': [0.1097] * 3 + [np.nan] + [0.1097] * 4 + [np.nan, 0.1097]
+        })
+        
+        result = normalize_today(df)
+        
+        assert (result['z_constant'] == 0.0).all()
+    
     def test_nan_handling(self):
         """Test handling of NaN values"""
         df = pd.DataFrame({
@@ -196,6 +210,18 @@ class TestComputeDirscore:
         assert isinstance(score, float)
         assert decision in ['CALL', 'PUT', 'PASS_OR_SPREAD']
     
+    def test_dict_row(self):
+        """Test that a plain dict scores the same as a Series"""
+        values = {
+            'z_rr_25d': 1.2,
+            'z_delta_oi_net': np.nan,
+            'z_net_thrust': 0.8,
+            'z_vol_pcr': -0.5,
+            'pct_iv_bump': 0.3
+        }
+        
+        assert compute_dirscore(values) == compute_dirscore(pd.Series(values))
+    
     def test_custom_weights(self):
         """Test using custom weights"""
         row = pd.Series({
@@ -273,6 +299,40 @@ class TestComputeScoresBatch:
         assert 'score' in result.columns
         assert 'decision' in result.columns
     
+    def test_prenormalized_input_not_renormalized(self):
+        """prenormalized=True scores existing z_ columns directly"""
+        df = pd.DataFrame({
+            'symbol': ['A', 'B', 'C', 'D'],
+            'rr_25d': [0.1, -0.2, 0.3, 0.0],
+            'vol_pcr': [0.8, 1.2, 0.9, 1.1],
+            'net_thrust': [0.5, -0.2, 0.8, 0.1]
+        })
+        df_norm = normalize_today(df)
+        df_norm['z_rr_25d'] = [2.0, -2.0, 0.0, 1.0]
+        
+        result = compute_scores_batch(df_norm, prenormalized=True)
+        expected_scores, expected_decisions = compute_dirscore_vectorized(df_norm)
+        
+        assert list(result['z_rr_25d']) == [2.0, -2.0, 0.0, 1.0]
+        np.testing.assert_allclose(result['score'], expected_scores)
+        assert list(result['decision']) == list(expected_decisions)
+    
+    def test_stale_z_column_does_not_skip_normalization(self):
+        """A lone stale z_ column is overwritten by normalizing the raw signals"""
+        df = pd.DataFrame({
+            'symbol': ['A', 'B', 'C', 'D'],
+            'rr_25d': [0.1, -0.2, 0.3, 0.0],
+            'vol_pcr': [0.8, 1.2, 0.9, 1.1],
+            'net_thrust': [0.5, -0.2, 0.8, 0.1]
+        })
+        expected = compute_scores_batch(df)
+        
+        result = compute_scores_batch(df.assign(z_rr_25d=[9.0, 9.0, 9.0, 9.0]))
+        
+        np.testing.assert_allclose(result['z_rr_25d'], expected['z_rr_25d'])
+        np.testing.assert_allclose(result['score'], expected['score'])
+        assert 'z_net_thrust' in result.columns
+    
     def test_score_distribution(self):
         """Test that scores have reasonable distribution"""
         # Create data with clear patterns
@@ -328,6 +388,61 @@ class TestScoringConsistency:
         # Should be identical
         assert abs(score_batch - score_manual) < 0.001
         assert decision_batch == decision_manual
+    
+    def test_vectorized_matches_row_wise(self):
+        """Test that vectorized scoring matches compute_dirscore per row"""
+        df = pd.DataFrame({
+            'z_rr_25d': [2.0, -2.0, np.nan, 0.1],
+            'z_delta_oi_net': [1.0, -1.0, 0.5, np.nan],
+            'z_net_thrust': [1.0, np.nan, -0.5, 0.0],
+            'z_call_thrust': [0.0, -1.0, 0.0, 0.3],
+            'z_put_thrust': [0.0, 1.0, 0.0, np.nan],
+            'z_vol_pcr': [-1.0, 1.0, np.nan, 0.2],
+            'z_beta_adj_return': [0.5, -0.5, 0.0, np.nan],
+            'pct_iv_bump': [0.2, 0.9, np.nan, 0.5],
+            'z_spread_pct_atm': [0.1, 0.3, 0.0, np.nan]
+        })
+        
+        scores, decisions = compute_dirscore_vectorized(df)
+        
+        for i, (_, row) in enumerate(df.iterrows()):
+            score, decision = compute_dirscore(row)
+            assert abs(scores[i] - score) < 1e-12
+            assert decisions[i] == decision
+        assert list(decisions[:2]) == ["CALL", "PUT"]
+
+
+# (score, pct_iv_bump, spread_pct, total_volume, (decision, structure))
+_INTRADAY_DECISION_CASES = [
+    # |score| bands: [0, 0.40) skip, [0.40, 0.60) vertical, >= 0.60 naked
+    (0.0, 0.5, 5.0, 100, ('PASS', 'SKIP')),
+    (0.3999, 0.5, 5.0, 100, ('PASS', 'SKIP')),
+    (-0.3999, 0.5, 5.0, 100, ('PASS', 'SKIP')),
+    (0.40, 0.5, 5.0, 100, ('CALL', 'VERTICAL')),
+    (-0.40, 0.5, 5.0, 100, ('PUT', 'VERTICAL')),
+    (0.5999, 0.5, 5.0, 100, ('CALL', 'VERTICAL')),
+    (0.60, 0.5, 5.0, 100, ('CALL', 'NAKED')),
+    (-0.60, 0.5, 5.0, 100, ('PUT', 'NAKED')),
+    # Rich IV (>= 0.80) caps naked at vertical but never rescues a skip
+    (0.60, 0.80, 5.0, 100, ('CALL', 'VERTICAL')),
+    (0.60, 0.7999, 5.0, 100, ('CALL', 'NAKED')),
+    (-0.45, 0.95, 5.0, 100, ('PUT', 'VERTICAL')),
+    (0.2, 0.95, 5.0, 100, ('PASS', 'SKIP')),
+    # Volume guard: below 10 skips, exactly 10 passes
+    (0.8, 0.5, 5.0, 9, ('PASS', 'SKIP')),
+    (0.8, 0.5, 5.0, 10, ('CALL', 'NAKED')),
+    # Spread guard: above 10% skips, exactly 10% passes
+    (0.8, 0.5, 10.0, 100, ('CALL', 'NAKED')),
+    (0.8, 0.5, 10.01, 100, ('PASS', 'SKIP')),
+    # Guards combined with each other and with rich IV
+    (-0.8, 0.9, 15.0, 5, ('PASS', 'SKIP')),
+    (0.8, 0.9, 15.0, 100, ('PASS', 'SKIP')),
+    (-0.5, 0.9, 5.0, 5, ('PASS', 'SKIP')),
+    # Missing inputs never trip a guard
+    (1.0, None, None, None, ('CALL', 'NAKED')),
+    (-0.7, np.nan, np.nan, np.nan, ('PUT', 'NAKED')),
+    (0.5, None, 20.0, None, ('PASS', 'SKIP')),
+]
 
 
 class TestIntradayScoring:
@@ -360,6 +475,25 @@ class TestIntradayScoring:
         assert abs(score - expected) < 1e-9
         assert direction == 'CALL'
 
+    def test_intraday_vectorized_matches_row_wise(self):
+        """Vectorized intraday scoring should match the per-row function."""
+
+        df = pd.DataFrame({
+            'z_rr_25d': [1.0, -1.5, np.nan],
+            'z_net_thrust': [0.5, -0.5, 0.2],
+            'z_vol_pcr': [-0.25, 1.0, np.nan],
+            'z_beta_adj_return': [0.2, np.nan, 0.0],
+            'pct_iv_bump': [0.4, 0.9, np.nan],
+            'z_spread_pct_atm': [0.1, 0.2, np.nan]
+        })
+
+        scores, directions = compute_intraday_dirscore_vectorized(df)
+
+        for i, (_, row) in enumerate(df.iterrows()):
+            score, direction = compute_intraday_dirscore(row)
+            assert abs(scores[i] - score) < 1e-12
+            assert directions[i] == direction
+
     def test_intraday_decision_guards(self):
         """Ensure guardrails enforce skips and structure changes."""
 
@@ -393,6 +527,26 @@ class TestIntradayScoring:
         assert decision == 'PASS'
         assert structure == 'SKIP'
 
+    @pytest.mark.parametrize(
+        "score, pct_iv, spread, volume, expected", _INTRADAY_DECISION_CASES
+    )
+    def test_intraday_decision_cases(self, score, pct_iv, spread, volume, expected):
+        """Band edges and every guardrail combination resolve as specified."""
+        assert resolve_intraday_decision(score, pct_iv, spread, volume) == expected
+
+    def test_intraday_decision_vectorized_cases(self):
+        """The column-wise resolver gives the same decisions for the whole table."""
+        scores, pct_iv, spread, volume, expected = zip(*_INTRADAY_DECISION_CASES)
+
+        def to_array(values):
+            return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+        decisions, structures = resolve_intraday_decision_vectorized(
+            np.array(scores), to_array(pct_iv), to_array(spread), to_array(volume)
+        )
+
+        assert list(zip(decisions, structures)) == list(expected)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
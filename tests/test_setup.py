@@ -1,14 +1,8 @@
 """
 Basic setup tests to verify installation and configuration
 """
-import os
-import sys
 from pathlib import Path
 
-# Add lib to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
-
 
 def test_imports():
     """Test that all modules can be imported"""
@@ -25,6 +19,16 @@ def test_imports():
     assert config is not None
 
 
+def test_supabase_client_stubbed(supabase_stub):
+    """Test that lib.supa and its cached table handles use the stub client"""
+    from lib import supa
+    
+    assert isinstance(supa.SUPA, supabase_stub)
+    for table in (supa.DAILY_SIGNALS_TBL, supa.OI_DELTAS_TBL, supa.OPTION_SNAPSHOTS_TBL):
+        assert isinstance(table, supabase_stub)
+        assert table.select("*").execute().data == []
+
+
 def test_directories_exist():
     """Test that all required directories exist"""
     project_root = Path(__file__).parent.parent
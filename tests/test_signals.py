@@ -14,30 +14,25 @@ from lib.signals import (
     compute_volume_thrust,
     compute_iv_bump,
     compute_spread_pct_atm,
-    compute_all_signals
+    compute_all_signals,
+    compute_all_signals_batch,
+    _atm_iv_soa,
+    _pcr_soa,
+    _rr_25d_soa,
+    _spread_pct_atm_soa,
+    _volume_thrust_soa
 )
 
 
 class TestInterpIVAtDelta:
     """Test IV interpolation at target delta"""
     
-    def test_basic_interpolation(self):
+    def test_basic_interpolation(self, sample_option_chain):
         """Test basic linear interpolation"""
-        contracts = [
-            {
-                "details": {"contract_type": "call"},
-                "greeks": {"delta": 0.20},
-                "implied_volatility": 0.30
-            },
-            {
-                "details": {"contract_type": "call"},
-                "greeks": {"delta": 0.30},
-                "implied_volatility": 0.35
-            }
-        ]
+        calls, _, _ = sample_option_chain
         
         # Should interpolate to 0.325 at delta=0.25
-        result = interp_iv_at_delta(contracts, target_delta=0.25, side="call")
+        result = interp_iv_at_delta(list(calls), target_delta=0.25, side="call")
         assert result is not None
         assert 0.30 <= result <= 0.35
         assert abs(result - 0.325) < 0.01
@@ -152,36 +147,16 @@ class TestATMIV:
 class TestComputeRR25D:
     """Test 25-delta risk reversal computation"""
     
-    def test_basic_rr(self):
+    def test_basic_rr(self, sample_option_chain):
         """Test basic RR calculation"""
-        contracts = [
-            {
-                "details": {"contract_type": "call"},
-                "greeks": {"delta": 0.25},
-                "implied_volatility": 0.35
-            },
-            {
-                "details": {"contract_type": "call"},
-                "greeks": {"delta": 0.30},
-                "implied_volatility": 0.36
-            },
-            {
-                "details": {"contract_type": "put"},
-                "greeks": {"delta": -0.25},
-                "implied_volatility": 0.32
-            },
-            {
-                "details": {"contract_type": "put"},
-                "greeks": {"delta": -0.20},
-                "implied_volatility": 0.31
-            }
-        ]
+        _, _, contracts = sample_option_chain
         
-        result = compute_rr_25d(contracts)
+        result = compute_rr_25d(list(contracts))
         assert result is not None
-        # RR = IV(25Δ call) - IV(25Δ put)
+        # RR = IV(25Δ call) - IV(25Δ put) = 0.325 - 0.30
         # Should be positive (bullish skew) in this case
         assert result > 0
+        assert abs(result - 0.025) < 1e-6
     
     def test_insufficient_data(self):
         """Test with insufficient data"""
@@ -189,6 +164,35 @@ class TestComputeRR25D:
         assert result is None
 
 
+def _reference_pcr(is_call, is_put, vol, price):
+    """Float64 oracle for compute_pcr: put/call totals over priced contracts"""
+    is_call = np.asarray(is_call, dtype=bool)
+    is_put = np.asarray(is_put, dtype=bool)
+    vol = np.asarray(vol, dtype=np.float64)
+    price = np.asarray(price, dtype=np.float64)
+    priced = price > 0
+    notional = vol * price * 100  # 100 shares per contract
+    
+    call_volume = vol[priced & is_call].sum()
+    call_notional = notional[priced & is_call].sum()
+    return {
+        "vol_pcr": vol[priced & is_put].sum() / call_volume if call_volume > 0 else None,
+        "notional_pcr": (
+            notional[priced & is_put].sum() / call_notional if call_notional > 0 else None
+        )
+    }
+
+
+def _assert_pcr_close(result, expected, rtol=1e-4):
+    """Compare PCR dicts key by key, treating None as an exact match"""
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        if value is None:
+            assert result[key] is None
+        else:
+            np.testing.assert_allclose(result[key], value, rtol=rtol)
+
+
 class TestComputePCR:
     """Test put-call ratio computation"""
     
@@ -208,15 +212,14 @@ class TestComputePCR:
         ]
         
         result = compute_pcr(contracts)
+        expected = _reference_pcr(
+            is_call=[True, False], is_put=[False, True], vol=[100, 80], price=[5.0, 4.5]
+        )
         
-        assert result['vol_pcr'] is not None
-        assert result['notional_pcr'] is not None
-        
-        # Volume PCR = 80/100 = 0.8
-        assert abs(result['vol_pcr'] - 0.8) < 0.01
-        
-        # Notional PCR = (80*4.5*100) / (100*5.0*100) = 0.72
-        assert abs(result['notional_pcr'] - 0.72) < 0.01
+        # Volume PCR = 80/100 = 0.8; notional PCR = (80*4.5*100) / (100*5.0*100) = 0.72
+        assert abs(expected['vol_pcr'] - 0.8) < 1e-12
+        assert abs(expected['notional_pcr'] - 0.72) < 1e-12
+        _assert_pcr_close(result, expected)
     
     def test_no_calls(self):
         """Test with no call volume"""
@@ -231,6 +234,7 @@ class TestComputePCR:
         result = compute_pcr(contracts)
         assert result['vol_pcr'] is None
         assert result['notional_pcr'] is None
+        _assert_pcr_close(result, _reference_pcr([False], [True], [100], [5.0]))
 
 
 class TestComputeVolumeThrust:
@@ -367,6 +371,123 @@ class TestComputeSpreadPctATM:
         assert 4.0 <= result <= 10.0
 
 
+class TestContractSoA:
+    """Test the array kernels behind the dict-input signal functions"""
+    
+    def test_soa_fields(self, sample_contract_soa):
+        """Test that contracts flatten to one record per contract"""
+        soa, contracts = sample_contract_soa
+        
+        assert len(soa) == len(contracts)
+        assert soa['is_call'].sum() == 3
+        assert soa['is_put'].sum() == 3
+        np.testing.assert_array_equal(soa['strike'][:3], [148.0, 150.0, 152.0])
+    
+    def test_atm_iv(self, sample_contract_soa):
+        """Test ATM IV kernel against the dict entrypoint"""
+        soa, contracts = sample_contract_soa
+        
+        result = _atm_iv_soa(soa, 150.0)
+        assert abs(result - 0.31) < 1e-9
+        assert result == atm_iv(list(contracts), spot_price=150.0)
+    
+    def test_rr_25d(self, sample_contract_soa):
+        """Test RR kernel: call wing interpolated, put wing clamped at 0.30Δ"""
+        soa, contracts = sample_contract_soa
+        
+        result = _rr_25d_soa(soa)
+        assert abs(result - ((0.33 - 0.02 / 6) - 0.32)) < 1e-9
+        assert result == compute_rr_25d(list(contracts))
+    
+    def test_pcr_and_thrust(self, sample_contract_soa):
+        """Test PCR and thrust kernels share the same volumes"""
+        soa, contracts = sample_contract_soa
+        med20 = {"call_med20": 200, "put_med20": 200}
+        
+        pcr = _pcr_soa(soa)
+        thrust = _volume_thrust_soa(soa, med20)
+        
+        assert abs(pcr['vol_pcr'] - 0.6) < 1e-9
+        _assert_pcr_close(
+            pcr, _reference_pcr(soa['is_call'], soa['is_put'], soa['vol'], soa['price'])
+        )
+        assert pcr == compute_pcr(list(contracts))
+        assert abs(thrust['net_thrust'] - 0.6) < 1e-9
+        assert thrust == compute_volume_thrust(list(contracts), med20)
+    
+    def test_spread(self, sample_contract_soa):
+        """Test spread kernel averages every quote in the ±5% band"""
+        soa, contracts = sample_contract_soa
+        
+        result = _spread_pct_atm_soa(soa, 150.0)
+        assert abs(result - (8.0 + 5.0 + 20.0 / 3) / 3) < 1e-9
+        assert result == compute_spread_pct_atm(list(contracts), spot_price=150.0)
+
+
+@pytest.mark.parametrize("n", [10, 257, 5000])
+@pytest.mark.parametrize("seed", [0, 1])
+class TestSignalProperties:
+    """Seeded property checks on large random chains"""
+    
+    def test_iv_at_delta_bounded_by_side_ivs(self, n, seed, random_chain):
+        """Clamped interpolation never leaves the range of valid side IVs"""
+        contracts = random_chain(np.random.default_rng(seed), n)
+        
+        for side in ("call", "put"):
+            ivs = [
+                c["implied_volatility"] for c in contracts
+                if c["details"]["contract_type"] == side
+                and c["implied_volatility"] is not None
+                and c["greeks"]["delta"] is not None
+            ]
+            result = interp_iv_at_delta(contracts, target_delta=0.25, side=side)
+            if len(ivs) < 2:
+                assert result is None
+            else:
+                assert min(ivs) <= result <= max(ivs)
+    
+    def test_invalid_contracts_ignored(self, n, seed, random_chain):
+        """Contracts without IV never change IV-based signals"""
+        contracts = random_chain(np.random.default_rng(seed), n)
+        valid = [c for c in contracts if c["implied_volatility"] is not None]
+        
+        assert compute_rr_25d(contracts) == compute_rr_25d(valid)
+        assert atm_iv(contracts, spot_price=150.0) == atm_iv(valid, spot_price=150.0)
+    
+    def test_pcr_matches_reference_sums(self, n, seed, random_chain):
+        """Both PCRs match the float64 reference; all-zero volume gives None"""
+        contracts = random_chain(np.random.default_rng(seed), n)
+        sides = [c["details"]["contract_type"] for c in contracts]
+        expected = _reference_pcr(
+            is_call=[side == "call" for side in sides],
+            is_put=[side == "put" for side in sides],
+            vol=[c["day"]["volume"] for c in contracts],
+            price=[c["last_trade"]["price"] for c in contracts]
+        )
+        
+        _assert_pcr_close(compute_pcr(contracts), expected)
+        
+        for c in contracts:
+            c["day"]["volume"] = 0
+        assert compute_pcr(contracts)['vol_pcr'] is None
+    
+    def test_spread_within_band_extremes(self, n, seed, random_chain):
+        """Average ATM spread lies between the tightest and widest ATM quote"""
+        contracts = random_chain(np.random.default_rng(seed), n)
+        band = [
+            (q["ask"] - q["bid"]) / ((q["ask"] + q["bid"]) / 2) * 100
+            for c in contracts
+            for q in [c["last_quote"]]
+            if abs(c["details"]["strike_price"] - 150.0) / 150.0 <= 0.05
+        ]
+        
+        result = compute_spread_pct_atm(contracts, spot_price=150.0)
+        if not band:
+            assert result is None
+        else:
+            assert min(band) - 1e-9 <= result <= max(band) + 1e-9
+
+
 class TestComputeAllSignals:
     """Test comprehensive signal computation"""
     
@@ -416,5 +537,59 @@ class TestComputeAllSignals:
             assert signals['vol_pcr'] > 0
 
 
+class TestComputeAllSignalsBatch:
+    """Test batched signal computation across events"""
+    
+    def test_batch_matches_per_event(self, sample_contract_soa, random_chain, monkeypatch):
+        """Each batch row matches compute_all_signals for that event"""
+        monkeypatch.setattr("lib.signals.compute_mom_betaadj", lambda *args, **kwargs: None)
+        _, contracts = sample_contract_soa
+        rng = np.random.default_rng(7)
+        events = [
+            {
+                "symbol": "AAA",
+                "event_date": date(2025, 11, 7),
+                "event_contracts": list(contracts),
+                "med20_volumes": {"call_med20": 200, "put_med20": 200}
+            },
+            {
+                "symbol": "BBB",
+                "event_date": date(2025, 11, 7),
+                "event_contracts": random_chain(rng, 300),
+                "next_contracts": list(contracts)
+            },
+            {"symbol": "CCC", "event_date": date(2025, 11, 7), "event_contracts": []}
+        ]
+        
+        result = compute_all_signals_batch(events)
+        
+        assert list(result['symbol']) == ["AAA", "BBB", "CCC"]
+        for i, event in enumerate(events):
+            expected = compute_all_signals(
+                event["symbol"],
+                event["event_date"],
+                event["event_contracts"],
+                next_contracts=event.get("next_contracts"),
+                med20_volumes=event.get("med20_volumes")
+            )
+            for key, value in expected.items():
+                if value is None:
+                    assert np.isnan(result[key].iloc[i]), key
+                else:
+                    assert abs(result[key].iloc[i] - value) < 1e-9, key
+    
+    def test_empty_batch(self, sample_contract_soa):
+        """Test with no events: empty frame with the same columns"""
+        _, contracts = sample_contract_soa
+        result = compute_all_signals_batch([])
+        full = compute_all_signals_batch(
+            [{"symbol": "AAA", "event_date": date(2025, 11, 7), "event_contracts": list(contracts)}],
+            include_momentum=False
+        )
+        
+        assert result.empty
+        assert list(result.columns) == list(full.columns)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""
+Micro-benchmarks for signal computation
+
+Each signal kernel runs on seeded random chains of 100, 1,000 and 10,000
+contracts, so complexity regressions show up as a change in how timings grow
+with size. Marked ``bench`` and skipped unless ``--run-benchmarks`` is
+given; requires ``pytest-benchmark`` (the ``dev`` extra) and skips without
+it. Save and gate against a baseline with:
+
+    pytest tests/test_signals_bench.py --run-benchmarks --benchmark-save=baseline
+    pytest tests/test_signals_bench.py --run-benchmarks --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+"""
+from datetime import date
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.bench
+
+pytest.importorskip("pytest_benchmark")
+
+from lib.signals import (
+    compute_all_signals_batch,
+    _atm_iv_soa,
+    _contracts_to_soa,
+    _pcr_soa,
+    _rr_25d_soa,
+    _spread_pct_atm_soa,
+    _volume_thrust_soa
+)
+
+SPOT = 150.0
+MED20 = {"call_med20": 5000, "put_med20": 5000}
+
+
+@pytest.fixture(scope="module", params=[100, 1000, 10000], ids=lambda n: f"n{n}")
+def bench_chain(request, random_chain):
+    """Contract dicts and their read-only SoA for one chain size"""
+    contracts = random_chain(np.random.default_rng(0), request.param, spot=SPOT)
+    soa = _contracts_to_soa(contracts)
+    soa.flags.writeable = False
+    return contracts, soa
+
+
+def test_bench_contracts_to_soa(benchmark, bench_chain):
+    contracts, _ = bench_chain
+    benchmark(_contracts_to_soa, contracts)
+
+
+def test_bench_atm_iv(benchmark, bench_chain):
+    _, soa = bench_chain
+    benchmark(_atm_iv_soa, soa, SPOT)
+
+
+def test_bench_rr_25d(benchmark, bench_chain):
+    _, soa = bench_chain
+    benchmark(_rr_25d_soa, soa)
+
+
+def test_bench_pcr(benchmark, bench_chain):
+    _, soa = bench_chain
+    benchmark(_pcr_soa, soa)
+
+
+def test_bench_volume_thrust(benchmark, bench_chain):
+    _, soa = bench_chain
+    benchmark(_volume_thrust_soa, soa, MED20)
+
+
+def test_bench_spread_pct_atm(benchmark, bench_chain):
+    _, soa = bench_chain
+    benchmark(_spread_pct_atm_soa, soa, SPOT)
+
+
+def test_bench_compute_all_signals_batch(benchmark, bench_chain):
+    contracts, _ = bench_chain
+    events = [
+        {
+            "symbol": symbol,
+            "event_date": date(2025, 10, 17),
+            "event_contracts": contracts,
+            "prev_contracts": contracts,
+            "next_contracts": contracts,
+            "med20_volumes": MED20
+        }
+        for symbol in ("AAPL", "MSFT", "NVDA", "AMZN")
+    ]
+    benchmark(compute_all_signals_batch, events, include_momentum=False)